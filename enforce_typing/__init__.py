@@ -1,5 +1,13 @@
 """Expose public methods."""
 from .enforce_typing import enforce_typing
 from .exceptions import EnforcedTypingError
+from .profiling import profile
+from .sampling import EveryNthCall, RandomSampler
 
-__all__ = ["EnforcedTypingError", "enforce_typing"]
+__all__ = [
+    "EnforcedTypingError",
+    "EveryNthCall",
+    "RandomSampler",
+    "enforce_typing",
+    "profile",
+]
@@ -1,43 +1,58 @@
 """Check stdlib type hints without __future__ annotations, or use of Typing lib."""
 from __future__ import annotations
 
+import typing
+
 from .exceptions import EnforcedTypingError
 from .type_parser import data_type_from_string
 
 
-def check_builtin_types(
-    arg_name: str,
-    arg_type: any,
-    func_arg_types: dict[any, any],
-):
+def _accept_any(_arg_value: any):
+    """Accept any value, for typing.Any and object."""
+
+
+_accept_any.checks_type_only = True
+
+
+def compile_builtin_checker(arg_name: str, type_hint: any) -> callable:
     """
-    Test to see if type hints used with stdlib types are correct.
+    Create a function which checks the type of a value against a stdlib type hint.
 
-    Args:
-        arg: str
-            The argument name.
+    The type hint is resolved to a class once, rather than on every call,
+    so a check is a single issubclass call. typing.Any and object accept
+    every value, so are not checked at all.
 
-        arg_type: any
-            The datatype of the argument.
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
 
-        func_arg_types: dict[any, any]
-            The type hints applied to the variables
-            of the function.
+        type_hint: any
+            The type hint applied to the argument.
 
-    Raises: EnforcedTypingError
-        If the data does not match
-        the datatype of the type
-        hint.
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if it is not of the type.
     """
-    if isinstance(func_arg_types[arg_name], str):
-        data_type = func_arg_types[arg_name]
+    if type_hint is typing.Any or type_hint is object:
+        return _accept_any
+
+    if type_hint is None:
+        expected_type = type(None)
+
+    elif isinstance(type_hint, type):
+        expected_type = type_hint
+
+    elif isinstance(type_hint, str):
+        expected_type = data_type_from_string(type_hint)
 
     else:
-        data_type = str(func_arg_types[arg_name].__qualname__)
-
-    received_arg_type = data_type_from_string(data_type)
-    if not issubclass(arg_type, received_arg_type):
-        raise EnforcedTypingError(
-            f"'{arg_name}' is a {arg_type}"
-            f", but should be {func_arg_types[arg_name]}."
-        )
+        expected_type = data_type_from_string(str(type_hint.__qualname__))
+
+    def check_builtin_type(arg_value: any):
+        if not issubclass(type(arg_value), expected_type):
+            raise EnforcedTypingError(
+                f"'{arg_name}' is a {type(arg_value)}, but should be {type_hint}."
+            )
+
+    check_builtin_type.checks_type_only = True
+    return check_builtin_type
@@ -0,0 +1,221 @@
+"""Module to check callables against Callable[[...], ...] type hints."""
+from __future__ import annotations
+
+import collections.abc
+import inspect
+import types
+import typing
+import weakref
+
+from .exceptions import EnforcedTypingError
+
+_UNCHECKED = object()
+_signature_cache: weakref.WeakKeyDictionary[any, dict[any, str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def is_callable_type(type_hint: any) -> bool:
+    """Return True if the type hint is typing.Callable or collections.abc.Callable."""
+    return (
+        type_hint is typing.Callable
+        or type_hint is collections.abc.Callable
+        or getattr(type_hint, "__origin__", None) is collections.abc.Callable
+    )
+
+
+def _hint_name(type_hint: any) -> str:
+    """Return a readable name for a type hint."""
+    if isinstance(type_hint, type):
+        return type_hint.__qualname__
+
+    return str(type_hint).replace("collections.abc.", "").replace("typing.", "")
+
+
+def _get_annotations(value: any) -> dict[str, any]:
+    """Return the resolved annotations of a callable, or {} if unavailable."""
+    try:
+        return typing.get_type_hints(value)
+
+    except Exception:  # pylint: disable=W0703
+        return {}
+
+
+def _is_incompatible(expected: any, annotated: any) -> bool:
+    """Return True if expected can never be passed as annotated."""
+    return (
+        isinstance(expected, type)
+        and isinstance(annotated, type)
+        and not issubclass(expected, annotated)
+    )
+
+
+def _argument_mismatch(
+    signature: inspect.Signature,
+    annotations: dict[str, any],
+    argument_types: list[any],
+) -> str:
+    """Describe why a signature cannot accept the argument types, or None."""
+    try:
+        bound = signature.bind(*argument_types)
+
+    except TypeError:
+        return f"cannot be called with {len(argument_types)} positional argument(s)"
+
+    for name, passed in bound.arguments.items():
+        passed_types = passed if isinstance(passed, tuple) else (passed,)
+        for passed_type in passed_types:
+            if _is_incompatible(passed_type, annotations.get(name)):
+                return (
+                    f"expects parameter '{name}' to be a "
+                    f"{_hint_name(annotations[name])}, not {_hint_name(passed_type)}"
+                )
+
+    return None
+
+
+def _signature_mismatch(value: any, type_hint: any) -> str:
+    """
+    Describe why a callable does not match a Callable type hint, or None.
+
+    Arguments and return values are only compared when both the hint
+    and the callable's annotation are classes, so callables without
+    annotations, or with Typing annotations, are accepted.
+    """
+    sub_types = getattr(type_hint, "__args__", None)
+    if not sub_types:
+        return None
+
+    try:
+        signature = inspect.signature(value)
+
+    except (TypeError, ValueError):
+        return None
+
+    annotations = _get_annotations(value)
+    *argument_types, return_type = sub_types
+    if argument_types != [Ellipsis]:
+        mismatch = _argument_mismatch(signature, annotations, argument_types)
+        if mismatch is not None:
+            return mismatch
+
+    if return_type is None:
+        return_type = type(None)
+
+    annotated_return = annotations.get("return")
+    if _is_incompatible(annotated_return, return_type):
+        return f"returns {_hint_name(annotated_return)}"
+
+    return None
+
+
+def _function_shape(func: any) -> tuple:
+    """
+    Return what the signature of a plain function depends on beside its code.
+
+    Returns None for other callables, and for wrappers with __wrapped__ or
+    __signature__, whose signatures do not come from their own code.
+    """
+    if (
+        not isinstance(func, types.FunctionType)
+        or "__wrapped__" in func.__dict__
+        or "__signature__" in func.__dict__
+    ):
+        return None
+
+    return (
+        len(func.__defaults__ or ()),
+        tuple(func.__kwdefaults__ or ()),
+        tuple(func.__annotations__.items()),
+    )
+
+
+def _cache_keys(value: any, type_hint: any) -> tuple[any, any]:
+    """
+    Return the object a callable is cached against, and its key in that cache.
+
+    Plain functions are cached against their code object, so lambdas and
+    closures created on every call share one entry, keyed together with
+    their defaults and annotations, which may differ between functions
+    sharing code. Wrappers are cached against the wrapper itself. Bound
+    methods are cached as their function, marked as bound, as binding
+    removes the first parameter.
+    """
+    if inspect.ismethod(value):
+        owner, hint_key = value.__func__, (type_hint, "bound")
+    else:
+        owner, hint_key = value, type_hint
+
+    shape = _function_shape(owner)
+    if shape is None:
+        return owner, hint_key
+
+    return owner.__code__, (hint_key, shape)
+
+
+def _cached_signature_mismatch(value: any, type_hint: any) -> str:
+    """
+    Return _signature_mismatch, cached per code object and type hint.
+
+    Entries are dropped when their code object, or wrapper, is garbage
+    collected. Callables which cannot be weakly referenced, such as
+    builtins, or with unhashable annotations, are inspected every time.
+    """
+    owner, hint_key = _cache_keys(value, type_hint)
+    try:
+        mismatch = _signature_cache[owner].get(hint_key, _UNCHECKED)
+
+    except KeyError:
+        mismatch = _UNCHECKED
+
+    except TypeError:
+        return _signature_mismatch(value, type_hint)
+
+    if mismatch is _UNCHECKED:
+        mismatch = _signature_mismatch(value, type_hint)
+        try:
+            _signature_cache.setdefault(owner, {})[hint_key] = mismatch
+
+        except TypeError:
+            pass
+
+    return mismatch
+
+
+def compile_callable_checker(arg_name: str, type_hint: any) -> callable:
+    """
+    Create a function which checks a value against a Callable type hint.
+
+    The value must be callable, must accept as many positional arguments
+    as the hint lists, and where it has annotations they must accept the
+    hint's argument types and return its return type. The comparison is
+    cached per code object, so passing the same callback, lambdas or
+    closures created on every call, or methods bound from the same
+    function, only inspects its signature once.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        type_hint: any
+            The Callable type hint.
+
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if it does not match.
+    """
+
+    def check_callable_type(arg_value: any):
+        if not callable(arg_value):
+            raise EnforcedTypingError(
+                f"'{arg_name}' is a {type(arg_value).__qualname__}"
+                f", but should be {_hint_name(type_hint)}."
+            )
+
+        mismatch = _cached_signature_mismatch(arg_value, type_hint)
+        if mismatch is not None:
+            raise EnforcedTypingError(
+                f"'{arg_name}' {mismatch}, but should be {_hint_name(type_hint)}."
+            )
+
+    return check_callable_type
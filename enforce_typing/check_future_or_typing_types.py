@@ -1,9 +1,11 @@
 """Module to enforce strict typing for functions decorated using the Typing module."""
 from __future__ import annotations
 
+import functools
 import re
 
 from .exceptions import EnforcedTypingError
+from .parallel import ParallelChecker
 from .type_parser import data_type_from_string
 
 
@@ -148,7 +150,6 @@ class CheckTyping:
 
     def _get_types(self):
         """Return the base and sub_types of the argument."""
-        print(self.expected_type)
         expected_type = self.expected_type.split("typing.")
         result = re.search(r"([A-z].*)(\[.*])", expected_type[len(expected_type) - 1])
         base_type: str = result.group(1)
@@ -202,3 +203,165 @@ class CheckTyping:
 
         except AttributeError:
             return
+
+
+def _is_valid_list(item_type: any, arg_value: any) -> bool:
+    """Return True if CheckTyping would accept a value for List[item_type]."""
+    if type(arg_value) is not list:
+        return False
+
+    for item in arg_value:
+        if not isinstance(item, item_type):
+            return False
+
+    return True
+
+
+def _is_valid_dict(key_type: any, value_type: any, arg_value: any) -> bool:
+    """Return True if CheckTyping would accept a value for a Dict[key, value]."""
+    if type(arg_value) is not dict:
+        return False
+
+    for key, value in arg_value.items():
+        if type(key) is not key_type or type(value) is not value_type:
+            return False
+
+    return True
+
+
+def _is_valid_tuple(item_types: tuple[any, ...], arg_value: any) -> bool:
+    """Return True if CheckTyping would accept a value for Tuple[*item_types]."""
+    if type(arg_value) is not tuple or len(arg_value) != len(item_types):
+        return False
+
+    for item, item_type in zip(arg_value, item_types):
+        if not isinstance(item, item_type):
+            return False
+
+    return True
+
+
+def _are_valid_pairs(
+    key_type: any,
+    value_type: any,
+    keys: list[any],
+    values: list[any],
+) -> bool:
+    """Return True if each key and value, paired by position, has the right type."""
+    for key, value in zip(keys, values):
+        if type(key) is not key_type or type(value) is not value_type:
+            return False
+
+    return True
+
+
+def _is_valid_large_list(
+    parallel: ParallelChecker,
+    is_valid_list: callable,
+    arg_value: any,
+) -> bool:
+    """Check a list in chunks on a pool, if it has at least parallel.threshold items."""
+    if type(arg_value) is not list or len(arg_value) < parallel.threshold:
+        return is_valid_list(arg_value)
+
+    return parallel.all_chunks_valid(is_valid_list, arg_value)
+
+
+def _is_valid_large_dict(
+    parallel: ParallelChecker,
+    is_valid_dict: callable,
+    arg_value: any,
+) -> bool:
+    """Check a dict in chunks on a pool, if it has at least parallel.threshold items."""
+    if type(arg_value) is not dict or len(arg_value) < parallel.threshold:
+        return is_valid_dict(arg_value)
+
+    return parallel.all_chunks_valid(
+        functools.partial(_are_valid_pairs, *is_valid_dict.args),
+        list(arg_value),
+        list(arg_value.values()),
+    )
+
+
+def _compile_is_valid(base_type: str, sub_types: list[any]) -> callable:
+    """Return a function which says if CheckTyping would accept a value, or None."""
+    if base_type == "list":
+        return functools.partial(_is_valid_list, sub_types[0])
+
+    if base_type == "dict":
+        return functools.partial(_is_valid_dict, *sub_types)
+
+    if base_type == "tuple":
+        return functools.partial(_is_valid_tuple, tuple(sub_types))
+
+    return None
+
+
+def compile_typing_checker(
+    arg_name: str,
+    expected_type: str,
+    parallel: ParallelChecker = None,
+) -> callable:
+    """
+    Create a function which checks a value against a Typing or __future__ hint.
+
+    The hint is parsed, and its sub types resolved, once. Each call then
+    only runs the comparisons CheckTyping.validate would make, without
+    creating a CheckTyping, matching a regex, or evaluating the hint, so
+    a value which passes allocates nothing beyond the loop over its
+    items. A value which fails is passed to CheckTyping.validate, which
+    raises the error for the first item which does not match, so the
+    index reported does not depend on how the items were checked.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        expected_type: str
+            The type hint, as a string.
+
+        parallel: ParallelChecker
+            Used to check the items of large lists
+            and dicts in chunks, across a pool.
+
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if it does not match.
+    """
+    try:
+        base_type, sub_types = CheckTyping(
+            arg_name=arg_name,
+            arg_type=None,
+            arg_value=None,
+            expected_type=expected_type,
+        )._get_types()  # pylint: disable=W0212
+
+    except AttributeError:
+        base_type, sub_types = "", []
+
+    is_valid = _compile_is_valid(base_type.lower(), sub_types)
+    if is_valid is None:
+        return _accept
+
+    if parallel is not None and base_type.lower() in _LARGE_CHECKS:
+        is_valid = functools.partial(
+            _LARGE_CHECKS[base_type.lower()], parallel, is_valid
+        )
+
+    def check_typing_type(arg_value: any):
+        if not is_valid(arg_value):
+            CheckTyping(
+                arg_name=arg_name,
+                arg_type=type(arg_value),
+                arg_value=arg_value,
+                expected_type=expected_type,
+            ).validate()
+
+    return check_typing_type
+
+
+def _accept(arg_value: any):  # pylint: disable=W0613
+    """Accept any value, for hints CheckTyping does not check."""
+
+
+_LARGE_CHECKS = {"list": _is_valid_large_list, "dict": _is_valid_large_dict}
@@ -0,0 +1,62 @@
+"""Module to check generic type hints, binding each TypeVar consistently.
+
+Hints containing TypeVars are checked by the structure checkers, which
+are passed a dict of the TypeVars bound so far in the call, shared by
+every argument and the return value.
+"""
+from __future__ import annotations
+
+import typing
+
+from .check_structured_types import compile_structure_checker
+from .exceptions import EnforcedTypingError
+
+
+def compile_bound_checker(arg_name: str, type_hint: any) -> callable:
+    """
+    Create a function which checks a value against a hint containing TypeVars.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        type_hint: any
+            The type hint applied to the argument.
+
+    Returns: callable
+        A function taking the value to check and the dict of
+        TypeVars bound so far in the call, which raises an
+        EnforcedTypingError if the value does not match.
+    """
+    structure_checker = compile_structure_checker(type_hint)
+
+    def check_generic_type(arg_value: any, bindings: dict[typing.TypeVar, type]):
+        mismatch = structure_checker(arg_value, bindings)
+        if mismatch is not None:
+            location, message = mismatch
+            raise EnforcedTypingError(f"'{arg_name}{location}' {message}")
+
+    check_generic_type.binds_type_vars = True
+    return check_generic_type
+
+
+def ignore_bindings(checker: callable) -> callable:
+    """
+    Adapt a checker to be called with the TypeVars bound in a call.
+
+    Args:
+        checker: callable
+            A checker taking only the value to check.
+
+    Returns: callable
+        A checker taking the value and the bindings, which
+        keeps whether the checker only checks the type.
+    """
+
+    def check_ignoring_bindings(arg_value: any, _bindings: dict[typing.TypeVar, type]):
+        checker(arg_value)
+
+    check_ignoring_bindings.checks_type_only = getattr(
+        checker, "checks_type_only", False
+    )
+    return check_ignoring_bindings
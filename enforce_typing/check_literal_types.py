@@ -0,0 +1,125 @@
+"""Module to check Literal and Enum type hints with precomputed members."""
+from __future__ import annotations
+
+import enum
+import typing
+
+from .exceptions import EnforcedTypingError
+
+_LITERAL = getattr(typing, "Literal", None)
+
+
+def is_literal_type(type_hint: any) -> bool:
+    """Return True if the type hint is a typing.Literal."""
+    return _LITERAL is not None and getattr(type_hint, "__origin__", None) is _LITERAL
+
+
+def contains_literal_type(type_hint: any) -> bool:
+    """Return True if the type hint is, or is subscripted with, a Literal."""
+    if is_literal_type(type_hint):
+        return True
+
+    return any(
+        contains_literal_type(sub_type)
+        for sub_type in getattr(type_hint, "__args__", None) or ()
+    )
+
+
+def is_enum_type(type_hint: any) -> bool:
+    """Return True if the type hint is an Enum class."""
+    return isinstance(type_hint, type) and issubclass(type_hint, enum.Enum)
+
+
+def literal_values(type_hint: any) -> dict[any, frozenset[type]]:
+    """
+    Map each value allowed by a Literal to the types it may have.
+
+    Values which are equal and hash the same, such as 1 and True, share
+    a key, so the types allowed for each value are kept alongside it.
+    Checking a value is then one dict lookup, and one frozenset lookup
+    of its type, so Literal[1] rejects True and Literal[True] rejects 1.
+
+    Args:
+        type_hint: any
+            The Literal type hint.
+
+    Returns: dict[any, frozenset[type]]
+        The allowed values, and the types allowed for each.
+    """
+    allowed: dict[any, frozenset[type]] = {}
+    for value in type_hint.__args__:
+        allowed[value] = allowed.get(value, frozenset()) | {type(value)}
+
+    return allowed
+
+
+def is_allowed_literal(allowed: dict[any, frozenset[type]], value: any) -> bool:
+    """Return True if a value, and its type, are allowed by literal_values."""
+    try:
+        return type(value) in allowed.get(value, ())
+
+    except TypeError:
+        return False
+
+
+def _literal_name(type_hint: any) -> str:
+    """Return a readable name for a Literal type hint."""
+    return str(type_hint).replace("typing.", "")
+
+
+def compile_literal_checker(arg_name: str, type_hint: any) -> callable:
+    """
+    Create a function which checks a value is one of the values of a Literal.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        type_hint: any
+            The Literal type hint.
+
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if it is not allowed.
+    """
+    allowed = literal_values(type_hint)
+
+    def check_literal_type(arg_value: any):
+        if not is_allowed_literal(allowed, arg_value):
+            raise EnforcedTypingError(
+                f"'{arg_name}' is {arg_value!r}"
+                f", but should be one of {_literal_name(type_hint)}."
+            )
+
+    return check_literal_type
+
+
+def compile_enum_checker(arg_name: str, type_hint: type) -> callable:
+    """
+    Create a function which checks a value is a member of an Enum.
+
+    Enums with members cannot be subclassed, so a value is a member
+    exactly when it is an instance of the Enum. Raw values, such as 1
+    for an IntEnum member, are rejected.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        type_hint: type
+            The Enum class.
+
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if it is not a member.
+    """
+
+    def check_enum_type(arg_value: any):
+        if not isinstance(arg_value, type_hint):
+            raise EnforcedTypingError(
+                f"'{arg_name}' is {arg_value!r}"
+                f", but should be a member of {type_hint.__qualname__}."
+            )
+
+    check_enum_type.checks_type_only = True
+    return check_enum_type
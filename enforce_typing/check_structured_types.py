@@ -0,0 +1,658 @@
+"""Module to check TypedDicts and dataclasses, including any records nested in them.
+
+Checkers compiled here take a value, and return None if it matches
+the type hint, or a (location, message) tuple describing the first
+mismatch, e.g. ("['user'].age", "is a str, but should be int.").
+Nothing is formatted unless the value does not match.
+
+With as_mappings=True, dataclasses are checked as dicts of their
+fields, for validating records which have been loaded from JSON.
+
+Checkers also take an optional dict of the TypeVars bound so far in a
+call, which is bound while the value is checked, so the items of a
+List[T] are only visited once, both to check them and to bind T. A
+TypeVar is bound to the type of the first value checked against it,
+and later values must be of the same type, except that bool and int
+values share a binding to int, so List[T] accepts [True, 1], but not
+[1, "1"]. Without bindings only the bound and constraints are checked.
+"""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import types
+import typing
+
+from .check_literal_types import is_allowed_literal, is_literal_type, literal_values
+
+_MISSING = object()
+_UNION_TYPE = getattr(types, "UnionType", ())
+
+# Types whose values may share the binding of a TypeVar, mapped to the
+# type it is widened to, from the type already bound and the new type.
+_WIDENED_BINDINGS = {(bool, int): int, (int, bool): int}
+
+
+def is_typeddict(type_hint: any) -> bool:
+    """Return True if the type hint is a TypedDict class."""
+    return (
+        isinstance(type_hint, type)
+        and issubclass(type_hint, dict)
+        and hasattr(type_hint, "__total__")
+    )
+
+
+def is_record_type(type_hint: any) -> bool:
+    """Return True if the type hint is a TypedDict or dataclass."""
+    return is_typeddict(type_hint) or (
+        isinstance(type_hint, type) and dataclasses.is_dataclass(type_hint)
+    )
+
+
+def contains_record_type(type_hint: any) -> bool:
+    """Return True if the type hint is, or is subscripted with, a record type."""
+    if is_record_type(type_hint):
+        return True
+
+    return any(
+        contains_record_type(sub_type)
+        for sub_type in getattr(type_hint, "__args__", None) or ()
+    )
+
+
+def contains_type_var(type_hint: any) -> bool:
+    """Return True if the type hint is, or is subscripted with, a TypeVar."""
+    if isinstance(type_hint, typing.TypeVar):
+        return True
+
+    return any(
+        contains_type_var(sub_type)
+        for sub_type in getattr(type_hint, "__args__", None) or ()
+    )
+
+
+def type_vars_in(type_hint: any) -> set[typing.TypeVar]:
+    """Return the TypeVars a type hint is, or is subscripted with."""
+    if isinstance(type_hint, typing.TypeVar):
+        return {type_hint}
+
+    sub_types = getattr(type_hint, "__args__", None) or ()
+    return set().union(*map(type_vars_in, sub_types))
+
+
+def _type_name(type_hint: any) -> str:
+    """Return a readable name for a type hint, e.g. Union[User, None]."""
+    if type_hint is None or type_hint is type(None):
+        return "None"
+
+    if isinstance(type_hint, type):
+        return type_hint.__qualname__
+
+    origin = getattr(type_hint, "__origin__", None)
+    sub_types = getattr(type_hint, "__args__", None)
+    if origin is None or not sub_types:
+        return str(type_hint).replace("typing.", "")
+
+    origin_name = "Union" if origin is typing.Union else _type_name(origin)
+    return f"{origin_name}[{', '.join(_type_name(sub) for sub in sub_types)}]"
+
+
+def _wrong_type(value: any, expected: any) -> tuple[str, str]:
+    """Describe a value which is not of the expected type."""
+    return (
+        "",
+        f"is a {type(value).__qualname__}, but should be {_type_name(expected)}.",
+    )
+
+
+def _accept(value: any, bindings: dict = None) -> None:  # pylint: disable=W0613
+    """Accept any value, for Any and hints which are not supported."""
+    return None
+
+
+def _compile_instance(type_hint: type) -> callable:
+    """Check a value is an instance of a class."""
+
+    def check_instance(value: any, _bindings: dict = None):
+        if not isinstance(value, type_hint):
+            return _wrong_type(value, type_hint)
+
+        return None
+
+    return check_instance
+
+
+def _compile_none(type_hint: any) -> callable:  # pylint: disable=W0613
+    """Check a value is None."""
+
+    def check_none(value: any, _bindings: dict = None):
+        if value is not None:
+            return _wrong_type(value, None)
+
+        return None
+
+    return check_none
+
+
+def _compile_class(type_hint: any) -> callable:
+    """Check a value is None, or an instance of a class, or accept it."""
+    if type_hint is None or type_hint is type(None):
+        return _compile_none(type_hint)
+
+    if isinstance(type_hint, type) and type_hint is not typing.Any:
+        return _compile_instance(type_hint)
+
+    return _accept
+
+
+def _compile_literal(
+    type_hint: any,
+    as_mappings: bool,  # pylint: disable=W0613
+) -> callable:
+    """Check a value is one of the values of a Literal."""
+    allowed = literal_values(type_hint)
+
+    def check_literal(value: any, _bindings: dict = None):
+        if not is_allowed_literal(allowed, value):
+            return ("", f"is {value!r}, but should be one of {_type_name(type_hint)}.")
+
+        return None
+
+    return check_literal
+
+
+def _compile_items(
+    collection_type: type,
+    item_type: any,
+    as_mappings: bool,
+) -> callable:
+    """Check a collection is of the right type, and check each of its items."""
+    item_checker = compile_structure_checker(item_type, as_mappings)
+
+    def check_items(value: any, bindings: dict = None):
+        if not isinstance(value, collection_type):
+            return _wrong_type(value, collection_type)
+
+        index = 0
+        for item in value:
+            mismatch = item_checker(item, bindings)
+            if mismatch is not None:
+                return (f"[{index}]{mismatch[0]}", mismatch[1])
+
+            index += 1
+
+        return None
+
+    return check_items
+
+
+def _compile_collection(type_hint: any, as_mappings: bool) -> callable:
+    """Check a list, set or frozenset and each of its items."""
+    return _compile_items(type_hint.__origin__, type_hint.__args__[0], as_mappings)
+
+
+def _compile_mapping(type_hint: any, as_mappings: bool) -> callable:
+    """Check a dict and each of its keys and values."""
+    key_checker, value_checker = (
+        compile_structure_checker(sub_type, as_mappings)
+        for sub_type in type_hint.__args__
+    )
+
+    def check_mapping(value: any, bindings: dict = None):
+        if not isinstance(value, dict):
+            return _wrong_type(value, dict)
+
+        for key, item in value.items():
+            mismatch = key_checker(key, bindings)
+            if mismatch is not None:
+                return (f" key {key!r}", mismatch[1])
+
+            mismatch = value_checker(item, bindings)
+            if mismatch is not None:
+                return (f"[{key!r}]{mismatch[0]}", mismatch[1])
+
+        return None
+
+    return check_mapping
+
+
+def _compile_tuple(type_hint: any, as_mappings: bool) -> callable:
+    """Check a tuple, its length, and each of its items."""
+    sub_types = [sub_type for sub_type in type_hint.__args__ if sub_type != ()]
+    if len(sub_types) == 2 and sub_types[1] is Ellipsis:
+        return _compile_items(tuple, sub_types[0], as_mappings)
+
+    item_checkers = [
+        compile_structure_checker(sub_type, as_mappings) for sub_type in sub_types
+    ]
+
+    def check_tuple(value: any, bindings: dict = None):
+        if not isinstance(value, tuple):
+            return _wrong_type(value, tuple)
+
+        if len(value) != len(item_checkers):
+            return (
+                "",
+                f"has a length of {len(value)}"
+                f", but should be a length of {len(item_checkers)}.",
+            )
+
+        index = 0
+        for item_checker in item_checkers:
+            mismatch = item_checker(value[index], bindings)
+            if mismatch is not None:
+                return (f"[{index}]{mismatch[0]}", mismatch[1])
+
+            index += 1
+
+        return None
+
+    return check_tuple
+
+
+def _check_restoring_bindings(
+    member_checker: callable,
+    type_vars: tuple[typing.TypeVar, ...],
+    value: any,
+    bindings: dict[typing.TypeVar, type],
+) -> tuple[str, str]:
+    """Check a value, restoring the TypeVars a failed check may have bound."""
+    if len(type_vars) == 1:
+        (type_var,) = type_vars
+        previous = bindings.get(type_var)
+        mismatch = member_checker(value, bindings)
+        if mismatch is not None:
+            bindings[type_var] = previous
+
+        return mismatch
+
+    previous_types = [bindings.get(type_var) for type_var in type_vars]
+    mismatch = member_checker(value, bindings)
+    if mismatch is not None:
+        bindings.update(zip(type_vars, previous_types))
+
+    return mismatch
+
+
+def _is_plain_class(type_hint: any) -> bool:
+    """Return True if a union member is checked by isinstance alone."""
+    return (
+        isinstance(type_hint, type)
+        and type_hint is not typing.Any
+        and not is_record_type(type_hint)
+    )
+
+
+def _compile_union(type_hint: any, as_mappings: bool) -> callable:
+    """
+    Check a value matches at least one member of a Union or Optional.
+
+    Members which are plain classes, including NoneType, are checked
+    first with one isinstance, so None matching Optional[T] does not
+    bind T to NoneType, and a value of another member formats nothing.
+    A member which fails part way through has the TypeVars it may have
+    bound restored, so they stay unbound for the next member.
+    """
+    plain_classes = tuple(filter(_is_plain_class, type_hint.__args__))
+    sub_types = sorted(
+        (sub_type for sub_type in type_hint.__args__ if sub_type not in plain_classes),
+        key=contains_type_var,
+    )
+    members = [
+        (
+            compile_structure_checker(sub_type, as_mappings),
+            tuple(type_vars_in(sub_type)),
+        )
+        for sub_type in sub_types
+    ]
+
+    def check_union(value: any, bindings: dict = None):
+        if isinstance(value, plain_classes):
+            return None
+
+        nested_mismatch = None
+        for member_checker, type_vars in members:
+            if bindings is None or not type_vars:
+                mismatch = member_checker(value, bindings)
+            else:
+                mismatch = _check_restoring_bindings(
+                    member_checker, type_vars, value, bindings
+                )
+
+            if mismatch is None:
+                return None
+
+            if mismatch[0] and nested_mismatch is None:
+                nested_mismatch = mismatch
+
+        return nested_mismatch or _wrong_type(value, type_hint)
+
+    return check_union
+
+
+def _resolve_class(type_hint: any) -> type:
+    """Return the class a bound or constraint checks against, or None."""
+    if isinstance(type_hint, type):
+        return type_hint
+
+    origin = getattr(type_hint, "__origin__", None)
+    return origin if isinstance(origin, type) else None
+
+
+def _type_var_limits(type_var: typing.TypeVar) -> tuple[tuple[type, ...], type]:
+    """
+    Resolve the constraints and bound of a TypeVar to classes.
+
+    Constraints which are not classes, or generics of a class, cannot be
+    told apart at runtime, so if any are found no constraints are checked.
+    """
+    constraints = tuple(
+        _resolve_class(constraint) for constraint in type_var.__constraints__
+    )
+    if None in constraints:
+        constraints = ()
+
+    return constraints, _resolve_class(type_var.__bound__)
+
+
+def _limit_type(
+    type_var: typing.TypeVar,
+    constraints: tuple[type, ...],
+    bound: type,
+    value_type: type,
+) -> tuple[type, tuple[str, str]]:
+    """Return the type a TypeVar is bound to, or why value_type is not allowed."""
+    for constraint in constraints:
+        if issubclass(value_type, constraint):
+            return constraint, None
+
+    if constraints:
+        return None, (
+            "",
+            f"is a {value_type.__qualname__}, but {type_var.__name__} should be "
+            f"one of {', '.join(_type_name(c) for c in constraints)}.",
+        )
+
+    if bound is not None and not issubclass(value_type, bound):
+        return None, (
+            "",
+            f"is a {value_type.__qualname__}, but {type_var.__name__} should be "
+            f"a subclass of {_type_name(bound)}.",
+        )
+
+    return value_type, None
+
+
+def _bind(
+    type_var: typing.TypeVar,
+    limits: tuple[tuple[type, ...], type],
+    value_type: type,
+    bindings: dict[typing.TypeVar, type],
+) -> tuple[str, str]:
+    """Bind a TypeVar to value_type, or describe why it cannot be bound."""
+    value_type, mismatch = _limit_type(type_var, *limits, value_type)
+    if mismatch is not None or bindings is None:
+        return mismatch
+
+    bound_type = bindings.get(type_var)
+    if bound_type is None:
+        bindings[type_var] = value_type
+        return None
+
+    if value_type is bound_type:
+        return None
+
+    widened_type = _WIDENED_BINDINGS.get((bound_type, value_type))
+    if widened_type is not None:
+        bindings[type_var] = widened_type
+        return None
+
+    return (
+        "",
+        f"is a {value_type.__qualname__}, but {type_var.__name__} "
+        f"is bound to {bound_type.__qualname__}.",
+    )
+
+
+def _compile_type_var(type_var: typing.TypeVar) -> callable:
+    """Check a value against a TypeVar, resolving its bound and constraints once."""
+    limits = _type_var_limits(type_var)
+
+    def check_type_var(value: any, bindings: dict = None):
+        return _bind(type_var, limits, type(value), bindings)
+
+    return check_type_var
+
+
+def _compile_class_of(
+    type_hint: any,
+    as_mappings: bool,  # pylint: disable=W0613
+) -> callable:
+    """Check a value is a class, binding the T of Type[T] to the class itself."""
+    type_var = type_hint.__args__[0]
+    limits = (
+        _type_var_limits(type_var) if isinstance(type_var, typing.TypeVar) else None
+    )
+
+    def check_class_of(value: any, bindings: dict = None):
+        if not isinstance(value, type):
+            return _wrong_type(value, type_hint)
+
+        if limits is None:
+            return None
+
+        return _bind(type_var, limits, value, bindings)
+
+    return check_class_of
+
+
+def _check_record(
+    record_type: type,
+    as_mappings: bool,
+    value: any,
+    _bindings: dict = None,
+):
+    """
+    Check a value against the cached checker for a record type.
+
+    Records are checked without the bindings of the call, as the
+    TypeVars of their fields belong to the record, not the call.
+    """
+    return record_checker(record_type, as_mappings)(value)
+
+
+_ORIGIN_COMPILERS = {
+    list: _compile_collection,
+    set: _compile_collection,
+    frozenset: _compile_collection,
+    dict: _compile_mapping,
+    tuple: _compile_tuple,
+    type: _compile_class_of,
+    typing.Union: _compile_union,
+}
+
+
+def compile_structure_checker(type_hint: any, as_mappings: bool = False) -> callable:
+    """
+    Create a function which checks a value against a type hint.
+
+    Records are checked through record_checker, so each record type is
+    compiled once no matter how many hints refer to it, and records
+    which refer to themselves do not recurse while compiling. Generics
+    which cannot be traversed without consuming the value, such as
+    Iterable[T], only have their origin checked.
+
+    Args:
+        type_hint: any
+            The type hint to check values against.
+
+        as_mappings: bool
+            Whether dataclasses should be checked as
+            dicts of their fields, rather than instances.
+
+    Returns: callable
+        A function taking a value, and optionally the dict of
+        TypeVars bound so far in the call, which returns None
+        if the value matches, or a (location, message) tuple.
+    """
+    if is_record_type(type_hint):
+        return functools.partial(_check_record, type_hint, as_mappings)
+
+    if isinstance(type_hint, typing.TypeVar):
+        return _compile_type_var(type_hint)
+
+    if isinstance(type_hint, _UNION_TYPE):
+        return _compile_union(type_hint, as_mappings)
+
+    if is_literal_type(type_hint):
+        return _compile_literal(type_hint, as_mappings)
+
+    origin = getattr(type_hint, "__origin__", None)
+    if origin in _ORIGIN_COMPILERS and getattr(type_hint, "__args__", None):
+        return _ORIGIN_COMPILERS[origin](type_hint, as_mappings)
+
+    if isinstance(origin, type):
+        return _compile_instance(origin)
+
+    return _compile_class(type_hint)
+
+
+def _record_type_hints(record_type: type) -> dict[str, any]:
+    """Return the resolved type hints of the fields of a record type."""
+    try:
+        type_hints = typing.get_type_hints(record_type)
+
+    except (NameError, TypeError):
+        type_hints = {}
+        for klass in reversed(record_type.__mro__):
+            type_hints.update(klass.__dict__.get("__annotations__", {}))
+
+    if dataclasses.is_dataclass(record_type):
+        return {
+            field.name: type_hints.get(field.name, typing.Any)
+            for field in dataclasses.fields(record_type)
+        }
+
+    return type_hints
+
+
+def _compile_record_mapping(
+    record_type: type,
+    key_checkers: dict[str, callable],
+    required_keys: tuple[str, ...],
+) -> callable:
+    """Check a dict has the required keys of a record, and no unknown keys."""
+
+    def check_record_mapping(value: any):
+        if not isinstance(value, dict):
+            return _wrong_type(value, record_type)
+
+        for key in required_keys:
+            if key not in value:
+                return (f"[{key!r}]", f"is required by {record_type.__qualname__}.")
+
+        for key, item in value.items():
+            key_checker = key_checkers.get(key)
+            if key_checker is None:
+                return (f"[{key!r}]", f"is not a key of {record_type.__qualname__}.")
+
+            mismatch = key_checker(item)
+            if mismatch is not None:
+                return (f"[{key!r}]{mismatch[0]}", mismatch[1])
+
+        return None
+
+    return check_record_mapping
+
+
+def _compile_typeddict(record_type: type, as_mappings: bool) -> callable:
+    """Check a dict against the keys of a TypedDict."""
+    key_checkers = {
+        key: compile_structure_checker(type_hint, as_mappings)
+        for key, type_hint in _record_type_hints(record_type).items()
+    }
+    required_keys = getattr(
+        record_type,
+        "__required_keys__",
+        key_checkers if record_type.__total__ else (),
+    )
+
+    return _compile_record_mapping(
+        record_type,
+        key_checkers,
+        tuple(key for key in key_checkers if key in required_keys),
+    )
+
+
+def _compile_dataclass_mapping(record_type: type) -> callable:
+    """Check a dict against the __init__ fields of a dataclass."""
+    init_fields = [field for field in dataclasses.fields(record_type) if field.init]
+    type_hints = _record_type_hints(record_type)
+
+    return _compile_record_mapping(
+        record_type,
+        {
+            field.name: compile_structure_checker(type_hints[field.name], True)
+            for field in init_fields
+        },
+        tuple(
+            field.name
+            for field in init_fields
+            if field.default is dataclasses.MISSING
+            and field.default_factory is dataclasses.MISSING
+        ),
+    )
+
+
+def _compile_dataclass(record_type: type) -> callable:
+    """Check an instance of a dataclass, and the value of each of its fields."""
+    field_checkers = tuple(
+        (name, compile_structure_checker(type_hint))
+        for name, type_hint in _record_type_hints(record_type).items()
+    )
+
+    def check_dataclass(value: any):
+        if not isinstance(value, record_type):
+            return _wrong_type(value, record_type)
+
+        for name, field_checker in field_checkers:
+            field_value = getattr(value, name, _MISSING)
+            if field_value is _MISSING:
+                continue
+
+            mismatch = field_checker(field_value)
+            if mismatch is not None:
+                return (f".{name}{mismatch[0]}", mismatch[1])
+
+        return None
+
+    return check_dataclass
+
+
+@functools.lru_cache(maxsize=None)
+def record_checker(record_type: type, as_mappings: bool = False) -> callable:
+    """
+    Return the checker for a TypedDict or dataclass.
+
+    The field type hints of each record type are resolved and compiled
+    once per process, and shared by every function which uses them.
+
+    Args:
+        record_type: type
+            The TypedDict or dataclass.
+
+        as_mappings: bool
+            Whether dataclasses should be checked as
+            dicts of their fields, rather than instances.
+
+    Returns: callable
+        A function taking a value, which returns None if the
+        value matches, or a (location, message) tuple.
+    """
+    if is_typeddict(record_type):
+        return _compile_typeddict(record_type, as_mappings)
+
+    if as_mappings:
+        return _compile_dataclass_mapping(record_type)
+
+    return _compile_dataclass(record_type)
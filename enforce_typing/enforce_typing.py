@@ -1,124 +1,537 @@
 """Module used to enforce strict typing for Python functions."""
 from __future__ import annotations
 
+import functools
 import inspect
-import re
+import sys
+from typing import Iterable, TypeVar
 
-from .check_builtin_types import check_builtin_types
-from .check_future_or_typing_types import CheckTyping
+from .exceptions import EnforcedTypingError
+from .parallel import ParallelChecker, get_parallel_checker
+from .profiling import Profiler
+from .reporting import ViolationReporter, get_reporter
+from .sampling import get_sampler
+from .validation_plan import ValidationPlan
+
+
+def _run_binding_checkers(
+    plan: ValidationPlan,
+    args: tuple[any, ...],
+    kwargs: dict[str, any],
+    bindings: dict[TypeVar, type],
+):
+    """Run the argument checkers of a plan which binds TypeVars."""
+    for index, checker in plan.positional_checkers:
+        if index < len(args):
+            checker(args[index], bindings)
+
+    for arg_name, arg_value in kwargs.items():
+        checker = plan.argument_checkers.get(arg_name)
+        if checker is not None:
+            checker(arg_value, bindings)
+
+
+def _run_argument_checkers(
+    plan: ValidationPlan,
+    args: tuple[any, ...],
+    kwargs: dict[str, any],
+    bindings: dict[TypeVar, type] = None,
+):
+    """
+    Run the argument checkers of a plan against the arguments of a call.
+
+    The checkers of plans which bind TypeVars are also passed the
+    bindings, which are kept separate so other plans pay nothing.
+    """
+    if bindings is not None:
+        _run_binding_checkers(plan, args, kwargs, bindings)
+        return
+
+    for index, checker in plan.positional_checkers:
+        if index < len(args):
+            checker(args[index])
+
+    if not kwargs:
+        return
+
+    for arg_name, arg_value in kwargs.items():
+        checker = plan.argument_checkers.get(arg_name)
+        if checker is not None:
+            checker(arg_value)
 
 
 def _check_argument_types(
-    func_args: dict[any, any],
-    func_arg_types: dict[any, any],
+    plan: ValidationPlan,
+    args: tuple[any, ...],
+    kwargs: dict[str, any],
+    bindings: dict[TypeVar, type] = None,
 ):
     """
     Check that the variables passed into a function are of the correct type.
 
-    Args:
-        func_args: dict[any, any]
-            The arguments passed into a function
-            when called.
+    If the plan caches signatures, and the types of the arguments match
+    a call which has already passed, only checks which look beyond the
+    type of an argument, e.g. at the items of a list, are run.
 
-        func_arg_types: dict[any, any]
-            The type hints applied to the variables
+    Args:
+        plan: ValidationPlan
+            The checks compiled from the type hints
             of the function.
+
+        args: tuple[any, ...]
+            The positional arguments passed into
+            a function when called.
+
+        kwargs: dict[str, any]
+            The keyword arguments passed into
+            a function when called.
+
+        bindings: dict[TypeVar, type]
+            The TypeVars bound so far in the call,
+            or None if the plan does not bind any.
     """
-    for arg_name, arg_value in list(func_args.items()):
-        if arg_name in func_arg_types:
-
-            if type(
-                func_arg_types[arg_name]
-            ).__qualname__ == "_GenericAlias" or re.match(
-                r"(^[a-z]*\[.*\]$)", str(func_arg_types[arg_name])
-            ):
-                CheckTyping(
-                    arg_name=arg_name,
-                    arg_type=type(arg_value),
-                    arg_value=arg_value,
-                    expected_type=(str(func_arg_types[arg_name])),
-                ).validate()
-
-            else:
-                check_builtin_types(
-                    arg_name=arg_name,
-                    arg_type=type(arg_value),
-                    func_arg_types=func_arg_types,
-                )
+    if not plan.max_signatures:
+        _run_argument_checkers(plan, args, kwargs, bindings)
+        return
+
+    if plan.matches_signature(args, kwargs):
+        if plan.content_plan is not None:
+            _run_argument_checkers(plan.content_plan, args, kwargs, bindings)
+
+        return
+
+    _run_argument_checkers(plan, args, kwargs, bindings)
+    plan.remember_signature(args, kwargs)
 
 
 def _check_return_types(
-    func_arg_types: dict[any, any],
-    return_type: any,
+    plan: ValidationPlan,
     return_value: any,
+    bindings: dict[TypeVar, type] = None,
 ):
     """
-    Check that the returned objectof a function is of the correct type.
+    Check that the returned object of a function is of the correct type.
 
     Args:
-        func_arg_types: dict[any, any]
-            The type hints applied to the variables
+        plan: ValidationPlan
+            The checks compiled from the type hints
             of the function.
 
-        return_type: any
-            The return type hint of the function.
-
         return_value: any
             The returned value of the function.
+
+        bindings: dict[TypeVar, type]
+            The TypeVars bound by the arguments,
+            or None if the plan does not bind any.
     """
-    if "return" in func_arg_types:
-        if type(func_arg_types["return"]).__qualname__ == "_GenericAlias" or re.match(
-            r"(^[a-z]*\[.*\]$)", str(func_arg_types["return"])
-        ):
-            CheckTyping(
-                arg_name="return",
-                arg_type=return_type,
-                arg_value=return_value,
-                expected_type=(str(func_arg_types["return"])),
-            ).validate()
-
-        else:
-            check_builtin_types(
-                arg_name="return",
-                arg_type=return_type,
-                func_arg_types=func_arg_types,
-            )
+    if plan.return_checker is None:
+        return
+
+    if bindings is None:
+        plan.return_checker(return_value)
+    else:
+        plan.return_checker(return_value, bindings)
+
+
+def _resolve_qualified_name(module_name: str, qualname: str) -> any:
+    """
+    Return the object found at module_name.qualname, or None.
+
+    Each object on the path is unwrapped, so a class whose name refers
+    to a wrapper, such as an enforced class, is found as the class.
+    """
+    found = sys.modules.get(module_name)
+    for attribute in qualname.split("."):
+        found = inspect.unwrap(getattr(found, attribute, None))
+
+    return found
+
+
+def _has_receiver(func: callable) -> bool:
+    """
+    Return True if func is a method which takes self or cls first.
+
+    Functions defined in a class body are methods, unless they are
+    found on their class as a staticmethod. Classes never have a
+    receiver, as their signature does not include self. If the class
+    cannot be found, e.g. as it was defined in a function, or the name
+    refers to something other than a class, the first argument is
+    checked, so that the arguments of a staticmethod are never skipped.
+    """
+    if inspect.isclass(func):
+        return False
+
+    *owner_path, name = func.__qualname__.split(".")
+    if not owner_path or owner_path[-1] == "<locals>":
+        return False
+
+    owner = _resolve_qualified_name(func.__module__, ".".join(owner_path))
+    if not inspect.isclass(owner):
+        return False
+
+    return not isinstance(inspect.getattr_static(owner, name, None), staticmethod)
+
+
+def _get_parameter_names(func: callable) -> set[str]:
+    """Return the parameter names of func and "return", or None if unknown."""
+    try:
+        return set(inspect.signature(func).parameters) | {"return"}
+
+    except (TypeError, ValueError):
+        return None
+
+
+def _check_parameter_names(
+    func: callable,
+    arg_names: Iterable[str],
+    known_names: set[str] = None,
+):
+    """
+    Raise a ValueError if any of arg_names are not parameters of func.
+
+    Args:
+        func: callable
+            The function, class or first accessor of a property.
+
+        arg_names: Iterable[str]
+            The names passed to enforce_typing.
+
+        known_names: set[str]
+            The names to check against, defaults
+            to the parameters of func.
+    """
+    if known_names is None:
+        known_names = _get_parameter_names(func)
+    if known_names is None:
+        return
+
+    unknown_names = set(arg_names) - known_names
+    if unknown_names:
+        raise ValueError(
+            f"{sorted(unknown_names)} are not parameters of {func.__qualname__}."
+        )
+
+
+def _compile_plans(
+    func: callable,
+    skip_receiver: bool,
+    options: dict[str, any],
+    reporter: ViolationReporter = None,
+    parallel: ParallelChecker = None,
+) -> tuple[ValidationPlan, ValidationPlan]:
+    """
+    Compile the validation plans for a function.
+
+    Returns: tuple[ValidationPlan, ValidationPlan]
+        The plan used on sampled calls, and the plan used
+        on every other call, which only includes checks
+        that are not sampled. In adaptive mode each plan
+        caches the argument signatures that passed it.
+        With a reporter, each checker reports violations.
+        With a ParallelChecker, large containers are checked
+        across a pool.
+    """
+    plan = ValidationPlan(
+        func,
+        skip_receiver=_has_receiver(func) if skip_receiver is None else skip_receiver,
+        parallel=parallel,
+    )
+
+    selected = set()
+    if options["check_arguments"]:
+        selected.update(
+            plan.argument_checkers
+            if options["parameters"] is None
+            else options["parameters"]
+        )
+    if options["check_return"]:
+        selected.add("return")
+
+    sampled_plan = plan.select(selected)
+    if options["sample"] is None:
+        unsampled_plan = sampled_plan
+    elif options["sampled_parameters"] is None:
+        unsampled_plan = plan.select(set())
+    else:
+        unsampled_plan = plan.select(selected - set(options["sampled_parameters"]))
+
+    if options["adaptive"]:
+        max_signatures = 8 if options["adaptive"] is True else options["adaptive"]
+        sampled_plan.cache_signatures(max_signatures)
+        if unsampled_plan is not sampled_plan:
+            unsampled_plan.cache_signatures(max_signatures)
 
+    if reporter is not None:
+        return reporter.wrap_plan(sampled_plan), reporter.wrap_plan(unsampled_plan)
 
-def enforce_typing(func: callable):
-    """Enforce variable types."""
+    return sampled_plan, unsampled_plan
 
+
+def _call_reporting_violations(
+    func: callable,
+    plan: ValidationPlan,
+    reporter: ViolationReporter,
+    args: tuple[any, ...],
+    kwargs: dict[str, any],
+) -> any:
+    """
+    Call a function, reporting violations of its plan rather than raising them.
+
+    The checkers of the plan report each violation before raising it,
+    so any EnforcedTypingError has already been reported, or suppressed.
+    Once the reporter is muted, calls are not checked at all.
+    """
+    if reporter.is_muted():
+        return func(*args, **kwargs)
+
+    bindings = plan.take_bindings() if plan.binds_type_vars else None
+    try:
+        _check_argument_types(plan=plan, args=args, kwargs=kwargs, bindings=bindings)
+
+    except EnforcedTypingError:
+        pass
+
+    function_result = func(*args, **kwargs)
+
+    try:
+        _check_return_types(plan=plan, return_value=function_result, bindings=bindings)
+
+    except EnforcedTypingError:
+        pass
+
+    if bindings is not None:
+        plan.release_bindings(bindings)
+
+    return function_result
+
+
+def _create_type_checker(
+    func: callable,
+    options: dict[str, any],
+    skip_receiver: bool = None,
+) -> callable:
+    """
+    Wrap a function or class in a function which checks its type hints.
+
+    The validation plans are compiled on the first call, so that methods
+    can be inspected on their finished class, and so that a function
+    unpickled by reference in another process compiles its own plans.
+    """
+    _check_parameter_names(func, options["parameters"] or ())
+    _check_parameter_names(func, options["sampled_parameters"] or ())
+    sampler = get_sampler(options["sample"])
+    reporter = get_reporter(func, options)
+    parallel = get_parallel_checker(options)
+    sampled_plan: ValidationPlan = None
+    unsampled_plan: ValidationPlan = None
+
+    @functools.wraps(func, updated=() if inspect.isclass(func) else ("__dict__",))
     def type_checker(*args, **kwargs):
         """Test argument vs value types."""
-        arguments = kwargs.copy()
-        if inspect.isclass(func):
-            try:
-                func_type_hints = func.__annotations__
-                arguments.update(zip(func_type_hints, args))
-
-            except AttributeError:
-                func_type_hints = func.__init__.__annotations__
-                if func_type_hints.get("return", None):
-                    func_type_hints["return"] = func
-                arguments.update(zip(func_type_hints, args))
-
-        else:
-            func_type_hints = func.__annotations__
-            arguments.update(zip(func.__code__.co_varnames, args))
-
-        _check_argument_types(
-            func_args=arguments,
-            func_arg_types=func_type_hints,
-        )
+        nonlocal sampled_plan, unsampled_plan
+        if sampled_plan is None:
+            sampled_plan, unsampled_plan = _compile_plans(
+                func, skip_receiver, options, reporter, parallel
+            )
+
+        plan = sampled_plan if sampler is None or sampler() else unsampled_plan
+        if Profiler.active is not None:
+            plan = Profiler.active.instrument(plan, func)
+
+        if reporter is not None:
+            return _call_reporting_violations(func, plan, reporter, args, kwargs)
+
+        bindings = plan.take_bindings() if plan.binds_type_vars else None
+        _check_argument_types(plan=plan, args=args, kwargs=kwargs, bindings=bindings)
 
         function_result = func(*args, **kwargs)
 
-        _check_return_types(
-            func_arg_types=func_type_hints,
-            return_type=type(function_result),
-            return_value=function_result,
-        )
+        _check_return_types(plan=plan, return_value=function_result, bindings=bindings)
+
+        if bindings is not None:
+            plan.release_bindings(bindings)
 
         return function_result
 
     return type_checker
+
+
+def _known_names(arg_names: Iterable[str], known_names: set[str]) -> list[str]:
+    """Return the arg_names in known_names, or arg_names if either is None."""
+    if arg_names is None or known_names is None:
+        return arg_names
+
+    return [arg_name for arg_name in arg_names if arg_name in known_names]
+
+
+def _enforce_property(prop: property, options: dict[str, any]) -> property:
+    """
+    Enforce the accessors of a property.
+
+    The names in parameters and sampled_parameters are checked against
+    the accessors together, e.g. "value" is a parameter of the setter,
+    and each accessor is passed only the names it has.
+    """
+    accessors = [accessor for accessor in (prop.fget, prop.fset, prop.fdel) if accessor]
+    accessor_names = [_get_parameter_names(accessor) for accessor in accessors]
+    if accessors and None not in accessor_names:
+        known_names = set().union(*accessor_names)
+        _check_parameter_names(accessors[0], options["parameters"] or (), known_names)
+        _check_parameter_names(
+            accessors[0], options["sampled_parameters"] or (), known_names
+        )
+
+    def enforce_accessor(accessor: callable) -> callable:
+        if accessor is None:
+            return None
+
+        known_names = _get_parameter_names(accessor)
+        return enforce_typing(
+            accessor,
+            **{
+                **options,
+                "parameters": _known_names(options["parameters"], known_names),
+                "sampled_parameters": _known_names(
+                    options["sampled_parameters"], known_names
+                ),
+            },
+        )
+
+    return property(
+        enforce_accessor(prop.fget),
+        enforce_accessor(prop.fset),
+        enforce_accessor(prop.fdel),
+        prop.__doc__,
+    )
+
+
+def enforce_typing(
+    func: callable = None,
+    *,
+    parameters: Iterable[str] = None,
+    check_arguments: bool = True,
+    check_return: bool = True,
+    sample: any = None,
+    sampled_parameters: Iterable[str] = None,
+    adaptive: any = False,
+    on_error: any = "raise",
+    max_reports: int = 10,
+    report_interval: float = 60.0,
+    parallel_threshold: int = None,
+    parallel_executor: any = "thread",
+    parallel_chunks: int = None,
+) -> callable:
+    """
+    Enforce variable types.
+
+    Functions, classes, and methods may be decorated, including
+    staticmethods, classmethods, and properties in either order.
+    The returned wrapper is a plain function, so methods are bound
+    by Python itself rather than by a Python-level descriptor.
+
+    Used without arguments every annotated argument and the return
+    value are checked on every call. Called with keyword arguments,
+    it returns a decorator which checks a selection of them.
+
+    Args:
+        func: callable
+            The function or class to decorate.
+
+        parameters: Iterable[str]
+            The names of the arguments to check,
+            defaults to every annotated argument.
+
+        check_arguments: bool
+            Whether to check the arguments.
+
+        check_return: bool
+            Whether to check the returned value.
+
+        sample: any
+            An int n to check one in every n calls,
+            or a callable taking no arguments which
+            returns True if a call should be checked,
+            such as a RandomSampler.
+
+        sampled_parameters: Iterable[str]
+            The names of the arguments, or "return",
+            which are only checked on sampled calls.
+            All other checks run on every call.
+            Defaults to sampling every check.
+
+        adaptive: any
+            True, or an int n, to remember the argument types
+            of up to 8, or n, calls which passed. Later calls
+            with the same argument types skip the checks which
+            only depend on the type of an argument, such as
+            int or str, but still check the contents of
+            containers and records. Matching a call costs
+            one dict lookup per argument, so it pays off
+            for several arguments, or for type checks such
+            as abstract base classes.
+
+        on_error: any
+            "raise" to raise an EnforcedTypingError, "log"
+            to log it as a warning on the "enforce_typing"
+            logger instead, or a callable taking the function
+            and the error. Reported violations are not raised.
+
+        max_reports: int
+            The most violations reported for the function
+            in each report_interval. Repeats of a violation,
+            for the same argument and type of value, are
+            only reported once per interval, and are found
+            without formatting a message. Once the limit is
+            reached, calls are not checked until the
+            interval ends.
+
+        report_interval: float
+            The length of the interval, in seconds.
+
+        parallel_threshold: int
+            The number of items at which the items of a
+            Typing List or Dict are split into chunks, and
+            checked across a pool. Defaults to checking
+            every item in the calling thread.
+
+        parallel_executor: any
+            "thread" or "process" to use a pool shared by
+            every enforced function, or an Executor. Threads
+            only check chunks at the same time on free-threaded
+            builds of Python, and processes need the items
+            to be picklable.
+
+        parallel_chunks: int
+            The number of chunks a large container is split
+            into, defaults to the number of CPUs.
+    """
+    options = {
+        "parameters": parameters,
+        "check_arguments": check_arguments,
+        "check_return": check_return,
+        "sample": sample,
+        "sampled_parameters": sampled_parameters,
+        "adaptive": adaptive,
+        "on_error": on_error,
+        "max_reports": max_reports,
+        "report_interval": report_interval,
+        "parallel_threshold": parallel_threshold,
+        "parallel_executor": parallel_executor,
+        "parallel_chunks": parallel_chunks,
+    }
+    if func is None:
+        return functools.partial(enforce_typing, **options)
+
+    if isinstance(func, property):
+        return _enforce_property(func, options)
+
+    if isinstance(func, (staticmethod, classmethod)):
+        return type(func)(
+            _create_type_checker(
+                func.__func__,
+                options,
+                skip_receiver=isinstance(func, classmethod),
+            )
+        )
+
+    return _create_type_checker(func, options)
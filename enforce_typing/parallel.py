@@ -0,0 +1,143 @@
+"""Module to check the items of very large containers in chunks, across a pool."""
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+_EXECUTOR_TYPES = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+_shared_executors: dict[str, Executor] = {}
+_shared_executors_lock = threading.Lock()
+
+
+def shared_executor(kind: str) -> Executor:
+    """
+    Return the pool shared by every enforced function using kind.
+
+    Args:
+        kind: str
+            "thread" or "process".
+
+    Returns: Executor
+        The pool, created on first use.
+    """
+    with _shared_executors_lock:
+        if kind not in _shared_executors:
+            _shared_executors[kind] = _EXECUTOR_TYPES[kind]()
+
+        return _shared_executors[kind]
+
+
+class ParallelChecker:
+    """
+    Split the item checks of large containers into chunks checked on a pool.
+
+    Containers with fewer items than threshold are checked in the calling
+    thread. Larger ones are split into one chunk per worker of the pool,
+    so each chunk is a single task, and the chunks are waited on in
+    order, so the result does not depend on which chunk finishes first.
+    Threads only check chunks at the same time on free-threaded builds
+    of Python, while processes need the items, and the types they are
+    checked against, to be picklable.
+    """
+
+    def __init__(self, threshold: int, executor: any = "thread", chunks: int = None):
+        """
+        Create a ParallelChecker.
+
+        Args:
+            threshold: int
+                The number of items at which a container
+                is split into chunks.
+
+            executor: any
+                "thread" or "process" to use a pool shared
+                by every enforced function, or an Executor.
+
+            chunks: int
+                The number of chunks a container is split
+                into, defaults to the number of CPUs, which
+                is the number of workers of a shared pool.
+        """
+        if threshold < 1:
+            raise ValueError(f"threshold must be at least 1, got {threshold}.")
+
+        if chunks is None:
+            chunks = os.cpu_count() or 1
+
+        if chunks < 1:
+            raise ValueError(f"chunks must be at least 1, got {chunks}.")
+
+        if not isinstance(executor, Executor) and executor not in _EXECUTOR_TYPES:
+            raise ValueError(
+                "executor must be 'thread', 'process' or an Executor"
+                f", got {executor!r}."
+            )
+
+        self.threshold = threshold
+        self.executor = executor
+        self.chunks = chunks
+
+    def _get_executor(self) -> Executor:
+        """Return the pool to check chunks on."""
+        if isinstance(self.executor, Executor):
+            return self.executor
+
+        return shared_executor(self.executor)
+
+    def all_chunks_valid(self, is_valid_chunk: callable, *columns: list) -> bool:
+        """
+        Return True if every chunk of the columns is valid.
+
+        Args:
+            is_valid_chunk: callable
+                A picklable function taking a slice of each
+                column, which returns True if it is valid.
+
+            *columns: list
+                Lists of equal length, such as the keys and
+                values of a dict, sliced at the same points.
+
+        Returns: bool
+            Whether every chunk is valid. The chunks are
+            waited on in order, and any which have not
+            started once one is invalid are cancelled.
+        """
+        executor = self._get_executor()
+        chunk_size = -(-len(columns[0]) // self.chunks)
+        futures = [
+            executor.submit(
+                is_valid_chunk,
+                *(column[slice(start, start + chunk_size)] for column in columns),
+            )
+            for start in range(0, len(columns[0]), chunk_size)
+        ]
+
+        try:
+            return all(future.result() for future in futures)
+
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def get_parallel_checker(options: dict[str, any]) -> ParallelChecker:
+    """
+    Convert the parallel options of enforce_typing to a ParallelChecker.
+
+    Args:
+        options: dict[str, any]
+            The options passed to enforce_typing.
+
+    Returns: ParallelChecker
+        The checker, or None if containers are
+        always checked in the calling thread.
+    """
+    if options["parallel_threshold"] is None:
+        return None
+
+    return ParallelChecker(
+        options["parallel_threshold"],
+        executor=options["parallel_executor"],
+        chunks=options["parallel_chunks"],
+    )
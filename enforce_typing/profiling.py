@@ -0,0 +1,219 @@
+"""Module to attribute the cost of enforcing types to individual annotations."""
+from __future__ import annotations
+
+import contextlib
+import functools
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Iterator, TextIO
+
+from .validation_plan import ValidationPlan
+
+
+def _annotation_name(type_hint: any) -> str:
+    """Return an annotation as it would have been written."""
+    if isinstance(type_hint, type):
+        return type_hint.__qualname__
+
+    return str(type_hint).replace("typing.", "")
+
+
+class AnnotationStats:
+    """The cost of checking one annotation, from one call site."""
+
+    def __init__(self):
+        """Create an empty AnnotationStats."""
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.peak_bytes = 0
+
+    def record(self, elapsed_ns: int, peak_bytes: int, failed: bool):
+        """Add the cost of one check."""
+        self.calls += 1
+        self.failures += failed
+        self.total_ns += elapsed_ns
+        self.peak_bytes = max(self.peak_bytes, peak_bytes)
+
+
+class Profiler:
+    """
+    Collect the time and memory spent checking each annotation.
+
+    While a Profiler is active, every check made by an enforced function,
+    in any thread, is timed and attributed to the function, the argument
+    and its annotation, and the line which called the function. Call
+    sites are tracked per thread, but tracemalloc only traces the peak
+    memory of the whole process, so peaks measured while other threads
+    run checks may include their allocations.
+    """
+
+    active: Profiler = None
+
+    def __init__(self, allocations: bool = True):
+        """
+        Create a Profiler.
+
+        Args:
+            allocations: bool
+                Whether to measure the peak memory
+                allocated by each check, using
+                tracemalloc.
+        """
+        self.allocations = allocations and hasattr(tracemalloc, "reset_peak")
+        self.stats: dict[tuple[str, str, str, str], AnnotationStats] = {}
+        self._calls = threading.local()
+        self._lock = threading.Lock()
+        self._plans: dict[int, tuple[ValidationPlan, ValidationPlan]] = {}
+
+    def instrument(self, plan: ValidationPlan, func: callable) -> ValidationPlan:
+        """
+        Return a copy of a plan, with each of its checkers measured.
+
+        The caller of the enforced function is recorded as the call site
+        for the checks which follow in the same thread, so instrument
+        should be called once per call, directly from the enforced function.
+        """
+        caller = sys._getframe(2)  # pylint: disable=W0212
+        self._calls.site = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+
+        with self._lock:
+            if id(plan) not in self._plans:
+                self._plans[id(plan)] = self._instrument_plan(plan, func)
+
+            return self._plans[id(plan)][1]
+
+    def _instrument_plan(
+        self, plan: ValidationPlan, func: callable
+    ) -> tuple[ValidationPlan, ValidationPlan]:
+        """
+        Pair a plan with a copy of it whose checkers are measured.
+
+        The plan is kept with its copy, so that its id is not reused
+        by another plan while the copy is cached.
+        """
+        return (
+            plan,
+            plan.map_checkers(
+                lambda arg_name, checker: functools.partial(
+                    self.measure,
+                    (
+                        func.__qualname__,
+                        arg_name,
+                        _annotation_name(plan.type_hints[arg_name]),
+                    ),
+                    checker,
+                )
+            ),
+        )
+
+    def measure(
+        self,
+        key: tuple[str, str, str],
+        checker: callable,
+        arg_value: any,
+        *bindings: dict[any, type],
+    ):
+        """Run a checker on a value, and record its cost against key."""
+        if self.allocations:
+            tracemalloc.reset_peak()
+            allocated_before = tracemalloc.get_traced_memory()[0]
+
+        failed = True
+        start = time.perf_counter_ns()
+        try:
+            checker(arg_value, *bindings)
+            failed = False
+
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            peak_bytes = (
+                tracemalloc.get_traced_memory()[1] - allocated_before
+                if self.allocations
+                else 0
+            )
+            call_site = getattr(self._calls, "site", "<unknown>")
+            with self._lock:
+                self.stats.setdefault((*key, call_site), AnnotationStats()).record(
+                    elapsed_ns, peak_bytes, failed
+                )
+
+    def report(self, limit: int = 20) -> str:
+        """
+        Return a table of the most expensive annotations.
+
+        Args:
+            limit: int
+                The number of rows to include.
+
+        Returns: str
+            The annotations sorted by the total time
+            spent checking them, most expensive first.
+        """
+        rows = sorted(
+            self.stats.items(),
+            key=lambda item: item[1].total_ns,
+            reverse=True,
+        )[:limit]
+
+        lines = [
+            "Hot annotations",
+            f"{'total ms':>10} {'calls':>8} {'mean us':>9} {'peak KiB':>9} "
+            f"{'failed':>7}  annotation",
+        ]
+        for (qualname, arg_name, annotation, call_site), stats in rows:
+            lines.append(
+                f"{stats.total_ns / 1e6:>10.3f} {stats.calls:>8} "
+                f"{stats.total_ns / stats.calls / 1e3:>9.2f} "
+                f"{stats.peak_bytes / 1024:>9.1f} {stats.failures:>7}  "
+                f"{qualname}({arg_name}: {annotation}) called at {call_site}"
+            )
+
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def profile(
+    file: TextIO = None,
+    limit: int = 20,
+    allocations: bool = True,
+) -> Iterator[Profiler]:
+    """
+    Profile the checks made by enforced functions within the block.
+
+    On exit, a report of the most expensive annotations is printed.
+
+    Args:
+        file: TextIO
+            Where to print the report, defaults to stderr.
+            Pass False to skip printing it.
+
+        limit: int
+            The number of annotations to report.
+
+        allocations: bool
+            Whether to measure the peak memory allocated by
+            each check. Starts tracemalloc if it is not
+            already tracing, which slows down all code.
+
+    Yields: Profiler
+        The profiler, whose stats can be inspected directly.
+    """
+    profiler = Profiler(allocations=allocations)
+    previous, Profiler.active = Profiler.active, profiler
+    start_tracing = profiler.allocations and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    try:
+        yield profiler
+
+    finally:
+        Profiler.active = previous
+        if start_tracing:
+            tracemalloc.stop()
+
+        if file is not False:
+            print(profiler.report(limit), file=file or sys.stderr)
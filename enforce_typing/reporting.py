@@ -0,0 +1,162 @@
+"""Module to report type violations through logging or a callback."""
+from __future__ import annotations
+
+import logging
+import time
+
+from .exceptions import EnforcedTypingError
+from .validation_plan import ValidationPlan
+
+logger = logging.getLogger("enforce_typing")
+
+
+class _SuppressedViolation(EnforcedTypingError):
+    """Raised in place of a violation which has already been reported."""
+
+
+class ViolationReporter:
+    """
+    Report the violations of one enforced function, with rate limiting.
+
+    Each argument, and the return value, reports at most one violation
+    per type of value in each interval, and the function reports at most
+    max_reports violations in each interval. Repeats are recognised from
+    the argument name and the type of the value before it is checked, so
+    a flood of identical violations formats no messages. Once the limit
+    is reached, calls are not checked until the interval ends.
+    """
+
+    def __init__(
+        self,
+        func: callable,
+        on_error: any,
+        max_reports: int = 10,
+        interval: float = 60.0,
+    ):
+        """
+        Create a ViolationReporter.
+
+        Args:
+            func: callable
+                The enforced function or class.
+
+            on_error: any
+                "log" to log each violation as a warning on
+                the "enforce_typing" logger, or a callable
+                taking the function and the EnforcedTypingError.
+
+            max_reports: int
+                The most violations to report in each interval.
+
+            interval: float
+                The length of each interval, in seconds.
+        """
+        if on_error != "log" and not callable(on_error):
+            raise ValueError(
+                f"on_error must be 'raise', 'log' or a callable, got {on_error!r}."
+            )
+
+        if max_reports < 1:
+            raise ValueError(f"max_reports must be at least 1, got {max_reports}.")
+
+        self.func = func
+        self.on_error = on_error
+        self.max_reports = max_reports
+        self.interval = interval
+        self.suppressed = 0
+        self._reported: set[tuple[str, type]] = set()
+        self._interval_end = 0.0
+
+    def is_muted(self) -> bool:
+        """Return True if no more violations can be reported in this interval."""
+        now = time.monotonic()
+        if now >= self._interval_end:
+            self._interval_end = now + self.interval
+            self._reported = set()
+
+        return len(self._reported) >= self.max_reports
+
+    def report(self, error: EnforcedTypingError):
+        """Log a violation, or pass it to the on_error callback."""
+        if self.on_error == "log":
+            logger.warning(
+                "%s.%s: %s", self.func.__module__, self.func.__qualname__, error
+            )
+        else:
+            self.on_error(self.func, error)
+
+    def wrap(self, arg_name: str, checker: callable) -> callable:
+        """
+        Return a checker which reports violations, and skips repeats.
+
+        Violations are still raised, so the enforced function can stop
+        checking the call, and so a call which failed is not cached by
+        adaptive mode. Repeats of a type only check are known to fail,
+        so they raise an error without a message, without running the
+        checker. Each repeat raises its own error, so none is shared
+        between threads or outlives the call that raised it.
+
+        Args:
+            arg_name: str
+                The name of the argument, or "return".
+
+            checker: callable
+                The checker to wrap.
+
+        Returns: callable
+            The reporting checker.
+        """
+        checks_type_only = getattr(checker, "checks_type_only", False)
+
+        def report_violations(arg_value: any, *bindings: dict[any, type]):
+            key = (arg_name, type(arg_value))
+            if key in self._reported:
+                if checks_type_only:
+                    self.suppressed += 1
+                    raise _SuppressedViolation
+
+                return
+
+            try:
+                checker(arg_value, *bindings)
+
+            except EnforcedTypingError as error:
+                if len(self._reported) < self.max_reports:
+                    self._reported.add(key)
+                    self.report(error)
+                else:
+                    self.suppressed += 1
+
+                raise
+
+        report_violations.checks_type_only = checks_type_only
+        return report_violations
+
+    def wrap_plan(self, plan: ValidationPlan) -> ValidationPlan:
+        """Return a copy of a plan whose checkers report their violations."""
+        return plan.map_checkers(self.wrap)
+
+
+def get_reporter(func: callable, options: dict[str, any]) -> ViolationReporter:
+    """
+    Convert the on_error options of enforce_typing to a ViolationReporter.
+
+    Args:
+        func: callable
+            The enforced function or class.
+
+        options: dict[str, any]
+            The options passed to enforce_typing.
+
+    Returns: ViolationReporter
+        The reporter, or None if violations are raised.
+    """
+    if options["on_error"] == "raise":
+        return None
+
+    return ViolationReporter(
+        func,
+        options["on_error"],
+        max_reports=options["max_reports"],
+        interval=options["report_interval"],
+    )
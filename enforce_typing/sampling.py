@@ -0,0 +1,74 @@
+"""Module to choose which calls of an enforced function are checked."""
+from __future__ import annotations
+
+import itertools
+import random
+
+
+class EveryNthCall:
+    """Deterministic sampler which selects the first of every n calls."""
+
+    def __init__(self, n: int):
+        """
+        Create an EveryNthCall sampler.
+
+        Args:
+            n: int
+                Select one call in every n.
+        """
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}.")
+
+        self.n = n
+        self._calls = itertools.count()
+
+    def __call__(self) -> bool:
+        """Return True if this call should be checked."""
+        return next(self._calls) % self.n == 0
+
+
+class RandomSampler:
+    """Random sampler which selects each call with a fixed probability."""
+
+    def __init__(self, rate: float, seed: any = None):
+        """
+        Create a RandomSampler.
+
+        Args:
+            rate: float
+                The probability, between 0 and 1,
+                that a call is selected.
+
+            seed: any
+                An optional seed, to make the
+                selected calls repeatable.
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError(f"rate must be between 0 and 1, got {rate}.")
+
+        self.rate = rate
+        self._random = random.Random(seed).random
+
+    def __call__(self) -> bool:
+        """Return True if this call should be checked."""
+        return self._random() < self.rate
+
+
+def get_sampler(sample: any) -> callable:
+    """
+    Convert the sample option of enforce_typing to a sampler.
+
+    Args:
+        sample: any
+            None to check every call, an int n to check
+            one in every n calls, or a callable taking no
+            arguments which returns True if a call should
+            be checked.
+
+    Returns: callable
+        The sampler, or None if every call is checked.
+    """
+    if sample is None or callable(sample):
+        return sample
+
+    return EveryNthCall(sample)
@@ -0,0 +1,42 @@
+"""Benchmark adaptive mode against checking every call.
+
+Usage:
+    python -m enforce_typing.tests.benchmark_adaptive
+
+Timings depend on the machine and its load, so they are reported
+rather than asserted. The tests count the checks which are skipped.
+"""
+import timeit
+from collections.abc import Hashable, Iterable, Mapping, Sequence, Sized
+
+from ..enforce_typing import enforce_typing
+
+
+def _fastest_call_ns(call: callable) -> float:
+    """Return the fastest time of a call, in nanoseconds, over several runs."""
+    return min(timeit.repeat(call, number=2000, repeat=20)) / 2000 * 1e9
+
+
+def _describe(
+    arg_a: Mapping, arg_b: Sequence, arg_c: Sized, arg_d: Hashable, arg_e: Iterable
+):
+    """Return arguments annotated with abstract base classes."""
+    return arg_a, arg_b, arg_c, arg_d, arg_e
+
+
+def main():
+    """Print the time of a call checked every time, and in adaptive mode."""
+    checked = enforce_typing(_describe)
+    adaptive = enforce_typing(_describe, adaptive=True)
+    arguments = ({}, [], "", 1, ())
+
+    checked_ns = _fastest_call_ns(lambda: checked(*arguments))
+    adaptive_ns = _fastest_call_ns(lambda: adaptive(*arguments))
+
+    print(f"checked:  {checked_ns:8.0f} ns per call")
+    print(f"adaptive: {adaptive_ns:8.0f} ns per call")
+    print(f"speed up: {checked_ns / adaptive_ns:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Test the adaptive cache of argument type signatures."""
+from collections.abc import Hashable, Iterable, Mapping, Sequence, Sized
+from typing import List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+from ..profiling import profile
+
+
+def _check_counts(profiler) -> dict:
+    """Return the number of times each argument was checked."""
+    counts = {}
+    for (_, arg_name, _, _), stats in profiler.stats.items():
+        counts[arg_name] = counts.get(arg_name, 0) + stats.calls
+
+    return counts
+
+
+def test_adaptive_skips_type_only_checks():
+    """Test a cached signature skips scalar checks, but not container checks."""
+
+    @enforce_typing(adaptive=True)
+    def test_adaptive(arg_a: int, arg_b: List[int]) -> int:
+        return arg_a
+
+    with profile(file=False, allocations=False) as profiler:
+        for _ in range(5):
+            assert test_adaptive(1, [1]) == 1
+
+    assert _check_counts(profiler) == {"arg_a": 1, "arg_b": 5, "return": 5}
+
+    with pytest.raises(EnforcedTypingError):
+        test_adaptive(1, ["1"])
+    with pytest.raises(EnforcedTypingError):
+        test_adaptive("1", [1])
+    with pytest.raises(EnforcedTypingError):
+        test_adaptive("1", [1])
+
+
+def test_adaptive_keyword_arguments():
+    """Test keyword arguments are part of the signature."""
+
+    @enforce_typing(adaptive=True)
+    def test_adaptive(arg_a: int, arg_b: str = "") -> int:
+        return arg_a
+
+    assert test_adaptive(1, arg_b="1") == 1
+    assert test_adaptive(1, arg_b="1") == 1
+
+    with pytest.raises(EnforcedTypingError):
+        test_adaptive(1, arg_b=1)
+    with pytest.raises(EnforcedTypingError):
+        test_adaptive(arg_a=1, arg_b=1)
+
+
+def test_adaptive_is_bounded():
+    """Test only max_signatures signatures are remembered."""
+
+    @enforce_typing(adaptive=1)
+    def test_adaptive(arg_a: int) -> int:
+        return arg_a
+
+    with profile(file=False, allocations=False) as profiler:
+        for _ in range(3):
+            test_adaptive(1)
+            test_adaptive(True)
+
+    assert _check_counts(profiler)["arg_a"] == 4
+
+
+def _describe(
+    arg_a: Mapping, arg_b: Sequence, arg_c: Sized, arg_d: Hashable, arg_e: Iterable
+):
+    """Return arguments annotated with abstract base classes."""
+    return arg_a, arg_b, arg_c, arg_d, arg_e
+
+
+def test_adaptive_skips_abstract_base_class_checks():
+    """Test a cached signature skips checks against abstract base classes."""
+    checked = enforce_typing(_describe)
+    adaptive = enforce_typing(_describe, adaptive=True)
+    arguments = ({}, [], "", 1, ())
+
+    with profile(file=False, allocations=False) as profiler:
+        for _ in range(5):
+            checked(*arguments)
+
+    assert set(_check_counts(profiler).values()) == {5}
+
+    with profile(file=False, allocations=False) as profiler:
+        for _ in range(5):
+            adaptive(*arguments)
+
+    assert set(_check_counts(profiler).values()) == {1}
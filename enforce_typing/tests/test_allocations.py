@@ -0,0 +1,146 @@
+"""Test enforced calls which pass do not allocate beyond the wrapped call."""
+import functools
+import tracemalloc
+from typing import Dict, List, Literal, Optional, Tuple, TypeVar
+
+import pytest
+
+from .test_structured_types import Address
+from ..enforce_typing import enforce_typing
+
+T = TypeVar("T")
+
+# tracemalloc counts objects parked on CPython's free lists, which hold
+# up to 2000 tuples of each size, so calls are warmed up past that first.
+_WARM_UP_CALLS = 3000
+_MEASURED_CALLS = 1000
+
+# Each loop a check runs creates an iterator, which plain Python cannot
+# avoid. The largest, a dict items view and its iterator, is allowed for
+# each level of nested loops, which is less than the table of a new dict.
+_LOOP_BYTES = 112
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(tracemalloc, "reset_peak"),
+    reason="tracemalloc.reset_peak needs Python 3.9",
+)
+
+
+def _measure(call: callable) -> Tuple[int, int]:
+    """Return the bytes retained by, and the peak bytes of, repeated calls."""
+    for _ in range(_WARM_UP_CALLS):
+        call()
+
+    calls = iter([call] * _MEASURED_CALLS)
+    tracemalloc.start()
+    try:
+        call()
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for each_call in calls:
+            each_call()
+
+        current, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return current - before, peak - before
+
+
+def _pass_through(func: callable) -> callable:
+    """Wrap a function without checking it, as a baseline for enforce_typing."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@enforce_typing
+def _scalars(arg_a: int, arg_b: str, arg_c: float = 1.0) -> int:
+    """Return the first of some built-in types."""
+    return arg_a
+
+
+@enforce_typing
+def _containers(
+    arg_a: List[int],
+    arg_b: Dict[str, int],
+    arg_c: Tuple[int, str],
+) -> List[int]:
+    """Return the first of some Typing containers."""
+    return arg_a
+
+
+@enforce_typing
+def _record(address: Address, kind: Literal["home", "work"]) -> None:
+    """Accept a TypedDict and a Literal."""
+
+
+@enforce_typing
+def _generic(items: List[T]) -> T:
+    """Return the first item of a list, bound to a TypeVar."""
+    return items[0]
+
+
+@enforce_typing
+def _optional(default: Optional[T], items: List[T]) -> T:
+    """Return the first item of a list, or a default bound to the same TypeVar."""
+    return items[0] if items else default
+
+
+@enforce_typing(adaptive=True)
+def _adaptive(arg_a: int, arg_b: List[int], arg_c: str = "") -> int:
+    """Return the first argument, checked in adaptive mode."""
+    return arg_a
+
+
+_ITEMS = list(range(100))
+_MAPPING = {"a": 1, "b": 2}
+_ADDRESS = {"street": "Main Street", "postcode": "AB1 2CD"}
+
+
+@pytest.mark.parametrize(
+    "func, args, kwargs, nested_loops",
+    [
+        (_scalars, (1, "1"), {}, 1),
+        (_scalars, (1,), {"arg_b": "1", "arg_c": 2.0}, 1),
+        (_containers, (_ITEMS, _MAPPING, (1, "1")), {}, 2),
+        (_record, (_ADDRESS, "home"), {}, 2),
+        (_generic, (_ITEMS,), {}, 2),
+        (_optional, (None, _ITEMS), {}, 2),
+        (_optional, (0, _ITEMS), {}, 2),
+        (_adaptive, (1, _ITEMS), {"arg_c": "1"}, 2),
+    ],
+    ids=[
+        "scalars",
+        "keywords",
+        "containers",
+        "record",
+        "generic",
+        "optional_none",
+        "optional",
+        "adaptive",
+    ],
+)
+def test_passing_calls_do_not_allocate(
+    func: callable, args: tuple, kwargs: dict, nested_loops: int
+):
+    """Test passing calls allocate no more than their loops beyond a plain wrapper."""
+    baseline = _pass_through(func.__wrapped__)
+    baseline_retained, baseline_peak = _measure(lambda: baseline(*args, **kwargs))
+    retained, peak = _measure(lambda: func(*args, **kwargs))
+
+    assert retained <= baseline_retained
+    assert peak - baseline_peak <= nested_loops * _LOOP_BYTES
+
+
+def test_adaptive_calls_do_not_allocate():
+    """Test matching a cached signature allocates nothing beyond a full check."""
+    checked = enforce_typing(_adaptive.__wrapped__)
+    _, checked_peak = _measure(lambda: checked(1, _ITEMS, "1"))
+    _, adaptive_peak = _measure(lambda: _adaptive(1, _ITEMS, "1"))
+
+    assert adaptive_peak <= checked_peak
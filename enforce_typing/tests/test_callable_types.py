@@ -0,0 +1,169 @@
+"""Test enforce typing module on Callable type hints."""
+import functools
+from typing import Callable, List
+
+import pytest
+
+from .. import check_callable_types
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+@enforce_typing
+def _apply(callback: Callable[[int, str], bool]) -> bool:
+    """Call a callback, used as an example."""
+    return callback(1, "1")
+
+
+def _matches(arg_a: int, arg_b: str) -> bool:
+    """Compare a number and a string, matching the hint."""
+    return str(arg_a) == arg_b
+
+
+def test_enforce_typing_callable():
+    """Test callables are checked for arity and annotations."""
+
+    def wrong_argument(arg_a: str, arg_b: str) -> bool:
+        return arg_a == arg_b
+
+    def wrong_return(arg_a: int, arg_b: str) -> str:
+        return arg_b * arg_a
+
+    def too_many(arg_a, arg_b, arg_c):
+        return arg_a, arg_b, arg_c
+
+    assert _apply(_matches)
+    assert _apply(lambda arg_a, arg_b: True)
+    assert _apply(lambda *args: True)
+    assert _apply(lambda arg_a, arg_b, arg_c=None: True)
+
+    with pytest.raises(EnforcedTypingError, match="is a int"):
+        _apply(1)
+    with pytest.raises(EnforcedTypingError, match="expects parameter 'arg_a'"):
+        _apply(wrong_argument)
+    with pytest.raises(EnforcedTypingError, match="returns str"):
+        _apply(wrong_return)
+    with pytest.raises(EnforcedTypingError, match="cannot be called with 2"):
+        _apply(too_many)
+    with pytest.raises(EnforcedTypingError, match="cannot be called with 2"):
+        _apply(lambda arg_a: True)
+
+
+def test_enforce_typing_callable_ellipsis():
+    """Test Callable[..., T] only checks the return annotation."""
+
+    @enforce_typing
+    def test_call(callback: Callable[..., list], name: Callable) -> int:
+        return len(callback())
+
+    def returns_list() -> List[int]:
+        return [1]
+
+    def returns_str() -> str:
+        return "1"
+
+    assert test_call(returns_list, print) == 1
+    assert test_call(lambda: [1], len) == 1
+
+    with pytest.raises(EnforcedTypingError):
+        test_call(returns_str, print)
+    with pytest.raises(EnforcedTypingError):
+        test_call(returns_list, "print")
+
+
+def test_callable_methods():
+    """Test bound methods are compared without self."""
+
+    class Example:  # pylint: disable=R0903
+        """Example class for testing purposes."""
+
+        def matches(self, arg_a: int, arg_b: str) -> bool:
+            """Compare a number and a string, matching the hint."""
+            return bool(self) and str(arg_a) == arg_b
+
+    assert _apply(Example().matches)
+
+
+def test_signature_is_cached(monkeypatch):
+    """Test each callable is only inspected once per hint."""
+    # pylint: disable=W0212
+    inspected = []
+    signature_mismatch = check_callable_types._signature_mismatch
+    monkeypatch.setattr(
+        check_callable_types,
+        "_signature_mismatch",
+        lambda *args: inspected.append(args) or signature_mismatch(*args),
+    )
+
+    def matches(arg_a: int, arg_b: str) -> bool:
+        return str(arg_a) == arg_b
+
+    for _ in range(10):
+        _apply(matches)
+
+    assert len(inspected) == 1
+
+
+def _make_matcher(arg_type: type) -> callable:
+    """Create a closure, sharing one code object across every matcher."""
+
+    def matcher(arg_a: arg_type, arg_b: str) -> bool:
+        return str(arg_a) == arg_b
+
+    return matcher
+
+
+def test_closures_share_cache(monkeypatch):
+    """Test closures made on every call are inspected once per annotations."""
+    # pylint: disable=W0212
+    inspected = []
+    signature_mismatch = check_callable_types._signature_mismatch
+    monkeypatch.setattr(
+        check_callable_types,
+        "_signature_mismatch",
+        lambda *args: inspected.append(args) or signature_mismatch(*args),
+    )
+
+    for _ in range(10):
+        _apply(_make_matcher(int))
+        _apply(lambda arg_a, arg_b: True)
+
+    assert len(inspected) == 2
+
+    with pytest.raises(EnforcedTypingError, match="expects parameter 'arg_a'"):
+        _apply(_make_matcher(bytes))
+
+    assert len(inspected) == 3
+
+    def unhashable(arg_a: [int], arg_b: str) -> bool:
+        return str(arg_a) == arg_b
+
+    assert _apply(unhashable) and _apply(unhashable)
+    assert len(inspected) == 5
+
+
+def _logged(func: callable) -> callable:
+    """Wrap a function, sharing one code object across every wrapper."""
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        return func(*args)
+
+    return wrapper
+
+
+def test_wrapped_callables():
+    """Test wrappers sharing a code object are inspected separately."""
+
+    @_logged
+    def two(arg_a: int, arg_b: str) -> bool:
+        return str(arg_a) == arg_b
+
+    @_logged
+    def three(arg_a, arg_b, arg_c):
+        return arg_a, arg_b, arg_c
+
+    assert _apply(two)
+
+    with pytest.raises(EnforcedTypingError, match="cannot be called with 2"):
+        _apply(three)
@@ -1,6 +1,8 @@
 """Module for classes used in testing."""
 from dataclasses import dataclass
 
+from ..enforce_typing import enforce_typing
+
 
 @dataclass
 class User:
@@ -8,3 +10,63 @@ class User:
 
     name: str
     age: int
+
+
+class Account:
+    """Example class with enforced methods for testing purposes."""
+
+    def __init__(self, balance: int):
+        """Create an Account."""
+        self._balance = balance
+
+    @enforce_typing
+    def deposit(self: str, amount: int) -> int:
+        """Add to the balance, self is deliberately mis-annotated."""
+        self._balance += amount
+        return self._balance
+
+    @enforce_typing
+    @staticmethod
+    def static_first(amount: int) -> int:
+        """Staticmethod decorated before enforce_typing."""
+        return amount
+
+    @staticmethod
+    @enforce_typing
+    def static_last(amount: int) -> int:
+        """Staticmethod decorated after enforce_typing."""
+        return amount
+
+    @enforce_typing
+    @classmethod
+    def class_first(cls, balance: int):
+        """Classmethod decorated before enforce_typing."""
+        return cls(balance)
+
+    @classmethod
+    @enforce_typing
+    def class_last(cls, balance: int):
+        """Classmethod decorated after enforce_typing."""
+        return cls(balance)
+
+    @enforce_typing
+    @property
+    def balance(self) -> int:
+        """Return the balance."""
+        return self._balance
+
+    @balance.setter
+    @enforce_typing
+    def balance(self, value: int):
+        """Set the balance."""
+        self._balance = value
+
+
+@enforce_typing
+class Customer:
+    """Example standard class decorated with enforce_typing."""
+
+    def __init__(self, name: str, age: int) -> None:
+        """Create a Customer."""
+        self.name = name
+        self.age = age
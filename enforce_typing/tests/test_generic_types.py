@@ -0,0 +1,149 @@
+"""Test enforce typing module on generic functions using TypeVars."""
+from numbers import Number
+from typing import Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+T = TypeVar("T")
+K = TypeVar("K")
+N = TypeVar("N", bound=Number)
+S = TypeVar("S", int, str)
+
+
+def test_enforce_typing_type_var_return():
+    """Test the return value must match the type bound by the arguments."""
+
+    @enforce_typing
+    def first(items: List[T]) -> T:
+        return items[0]
+
+    @enforce_typing
+    def broken_first(items: List[T]) -> T:
+        return str(items[0])
+
+    assert first([1, 2]) == 1
+    assert first(["a"]) == "a"
+
+    with pytest.raises(EnforcedTypingError, match="'return' is a str, but T is bound"):
+        broken_first([1, 2])
+
+
+def test_enforce_typing_type_var_arguments():
+    """Test every argument using a TypeVar must agree on its type."""
+
+    @enforce_typing
+    def pick(default: T, values: Dict[K, T], key: K) -> T:
+        return values.get(key, default)
+
+    assert pick(0, {"a": 1}, "a") == 1
+    assert pick(0, {"a": True}, "b") == 0
+
+    with pytest.raises(EnforcedTypingError, match="'values\\['a'\\]' is a str"):
+        pick(0, {"a": "1"}, "a")
+
+    with pytest.raises(EnforcedTypingError, match="'key' is a int, but K is bound"):
+        pick(0, {"a": 1}, 1)
+
+
+@enforce_typing
+def _same_items(items: List[T]) -> List[T]:
+    """Return a list of items which share one type."""
+    return items
+
+
+def test_enforce_typing_type_var_widens():
+    """Test a binding of int or bool widens to int, in either order."""
+    assert _same_items([True, 1]) == [True, 1]
+    assert _same_items([1, True]) == [1, True]
+
+    with pytest.raises(EnforcedTypingError, match="'items\\[1\\]' is a str"):
+        _same_items([1, "1"])
+
+
+def test_enforce_typing_type_var_base_classes():
+    """Test a binding does not widen to a base class, in either order."""
+    marker = object()
+
+    with pytest.raises(EnforcedTypingError, match="'items\\[1\\]' is a int"):
+        _same_items([marker, 1, "x"])
+
+    with pytest.raises(EnforcedTypingError, match="'items\\[1\\]' is a str"):
+        _same_items([1, "x", marker])
+
+    with pytest.raises(EnforcedTypingError, match="'items\\[1\\]' is a object"):
+        _same_items([1, marker])
+
+
+def test_enforce_typing_bound_and_constrained_type_vars():
+    """Test TypeVar bounds and constraints are enforced."""
+
+    @enforce_typing
+    def total(values: List[N]) -> N:
+        return sum(values)
+
+    @enforce_typing
+    def double(value: S) -> S:
+        return value * 2
+
+    assert total([1, 2]) == 3
+    assert double(2) == 4
+    assert double("a") == "aa"
+
+    with pytest.raises(EnforcedTypingError, match="N should be a subclass of Number"):
+        total(["a"])
+
+    with pytest.raises(EnforcedTypingError, match="S should be one of int, str"):
+        double(1.5)
+
+
+def test_enforce_typing_type_var_unions_and_classes():
+    """Test Optional, Tuple and Type hints bind TypeVars."""
+
+    @enforce_typing
+    def create(klass: Type[T], value: Optional[T] = None) -> Tuple[T, ...]:
+        return (klass() if value is None else value,)
+
+    assert create(int) == (0,)
+    assert create(int, 1) == (1,)
+
+    with pytest.raises(EnforcedTypingError, match="'value' is a str"):
+        create(int, "1")
+
+    with pytest.raises(EnforcedTypingError, match="'klass' is a int"):
+        create(1)
+
+
+def test_enforce_typing_optional_type_var_accepts_none():
+    """Test None matching Optional[T] does not bind T to NoneType."""
+
+    @enforce_typing
+    def get(default: Optional[T], items: List[T]) -> Optional[T]:
+        return items[0] if items else default
+
+    @enforce_typing
+    def pick(value: Optional[T], other: T) -> T:
+        return other if value is None else value
+
+    assert get(None, [1]) == 1
+    assert pick(None, 1) == 1
+    assert pick(2, 1) == 2
+
+    with pytest.raises(EnforcedTypingError, match="T is bound to int"):
+        pick(1, "1")
+
+
+def test_enforce_typing_failed_union_member_unbinds():
+    """Test a Union member which fails part way does not leave TypeVars bound."""
+
+    @enforce_typing
+    def second(pair: Union[Tuple[T, int], Tuple[str, T]], other: T) -> T:
+        return other
+
+    assert second(("a", 1), "b") == "b"
+    assert second(("a", 1.5), 2.5) == 2.5
+
+    with pytest.raises(EnforcedTypingError, match="T is bound to float"):
+        second(("a", 1.5), "b")
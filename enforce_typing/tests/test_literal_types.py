@@ -0,0 +1,123 @@
+"""Test enforce typing module on Literal and Enum type hints."""
+import enum
+from typing import List, Literal, TypedDict
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+class Colour(enum.Enum):
+    """Example Enum."""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class Priority(enum.IntEnum):
+    """Example IntEnum."""
+
+    LOW = 1
+    HIGH = 2
+
+
+class Message(TypedDict):
+    """Example record with a Literal field."""
+
+    kind: Literal["ping", "pong"]
+    payload: str
+
+
+def test_enforce_typing_literal():
+    """Test values are checked against the values of a Literal."""
+
+    @enforce_typing
+    def handle(kind: Literal["create", "delete"]) -> Literal[0, 1]:
+        return 0 if kind == "create" else 1
+
+    assert handle("create") == 0
+    assert handle("delete") == 1
+
+    with pytest.raises(EnforcedTypingError, match="'kind' is 'update'"):
+        handle("update")
+
+    with pytest.raises(EnforcedTypingError, match="'kind' is \\['create'\\]"):
+        handle(["create"])
+
+
+def test_enforce_typing_literal_bool_and_int():
+    """Test equal values of different types, such as 1 and True, are told apart."""
+
+    @enforce_typing
+    def count(value: Literal[1, 2]) -> None:
+        pass
+
+    @enforce_typing
+    def flag(value: Literal[True]) -> None:
+        pass
+
+    @enforce_typing
+    def either(value: Literal[1, True]) -> None:
+        pass
+
+    count(1)
+    flag(True)
+    either(1)
+    either(True)
+
+    with pytest.raises(EnforcedTypingError, match="'value' is True"):
+        count(True)
+
+    with pytest.raises(EnforcedTypingError, match="'value' is 1"):
+        flag(1)
+
+    with pytest.raises(EnforcedTypingError, match="'value' is 1.0"):
+        count(1.0)
+
+
+def test_enforce_typing_enum():
+    """Test values are checked against the members of an Enum."""
+
+    @enforce_typing
+    def paint(colour: Colour, priority: Priority) -> Colour:
+        return colour
+
+    assert paint(Colour.RED, Priority.HIGH) is Colour.RED
+
+    with pytest.raises(EnforcedTypingError, match="should be a member of Colour"):
+        paint("red", Priority.HIGH)
+
+    with pytest.raises(EnforcedTypingError, match="'priority' is 2"):
+        paint(Colour.BLUE, 2)
+
+
+def test_enforce_typing_nested_literal():
+    """Test Literals nested in records and containers are checked."""
+
+    @enforce_typing
+    def receive(messages: List[Message]) -> int:
+        return len(messages)
+
+    assert receive([{"kind": "ping", "payload": ""}]) == 1
+
+    with pytest.raises(
+        EnforcedTypingError,
+        match="'messages\\[0\\]\\['kind'\\]' is 'pang', but should be one of",
+    ):
+        receive([{"kind": "pang", "payload": ""}])
+
+
+def test_enforce_typing_literal_in_container():
+    """Test Literals nested in Typing containers are checked."""
+
+    @enforce_typing
+    def tag(labels: List[Literal["a", "b"]]) -> int:
+        return len(labels)
+
+    assert tag(["a", "b"]) == 2
+
+    with pytest.raises(
+        EnforcedTypingError, match="'labels\\[1\\]' is 'z', but should be one of"
+    ):
+        tag(["a", "z"])
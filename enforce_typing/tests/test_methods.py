@@ -0,0 +1,145 @@
+"""Test enforce typing module on methods, staticmethods and classmethods."""
+from types import FunctionType, MethodType
+
+import pytest
+
+from .test_classes import Account, Customer
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+def _make_parser():
+    """Define a class in a function, so it cannot be found by its qualname."""
+
+    class Parser:
+        """Example class with methods which cannot be found on their module."""
+
+        @staticmethod
+        @enforce_typing
+        def parse(value: int, base: int) -> str:
+            """Format a number in base 10 or 16."""
+            return hex(value) if base == 16 else str(value)
+
+        @enforce_typing
+        def scale(self, value: int) -> int:
+            """Double a number."""
+            return value * 2
+
+    return Parser
+
+
+@enforce_typing
+class Service:
+    """Example enforced class, so its name refers to a wrapper on the module."""
+
+    def __init__(self, name: str):
+        """Create a Service."""
+        self.name = name
+
+    @staticmethod
+    @enforce_typing
+    def parse(value: int, base: int) -> str:
+        """Format a number in base 10 or 16."""
+        return hex(value) if base == 16 else str(value)
+
+    @enforce_typing
+    def scale(self, value: int) -> int:
+        """Double a number."""
+        return value * 2
+
+
+def test_instance_method():
+    """Test arguments of a method are checked, but self is not."""
+    account = Account(1)
+
+    assert account.deposit(2) == 3
+    assert Account.deposit(account, 2) == 5
+
+    with pytest.raises(EnforcedTypingError):
+        account.deposit("2")
+
+
+def test_bound_method_is_method_type():
+    """Test binding an enforced method does not add a wrapper function."""
+    account = Account(1)
+
+    assert isinstance(account.deposit, MethodType)
+    assert isinstance(account.deposit.__func__, FunctionType)
+    assert account.deposit.__func__ is Account.__dict__["deposit"]
+    assert account.deposit.__name__ == "deposit"
+
+
+@pytest.mark.parametrize("method", ["static_first", "static_last"])
+def test_staticmethod(method):
+    """Test staticmethods in either decorator order."""
+    assert getattr(Account, method)(1) == 1
+    assert getattr(Account(1), method)(1) == 1
+
+    with pytest.raises(EnforcedTypingError):
+        getattr(Account, method)("1")
+
+
+@pytest.mark.parametrize("method", ["class_first", "class_last"])
+def test_classmethod(method):
+    """Test classmethods in either decorator order."""
+    assert getattr(Account, method)(1).balance == 1
+    assert getattr(Account(1), method)(2).balance == 2
+
+    with pytest.raises(EnforcedTypingError):
+        getattr(Account, method)("1")
+
+
+def test_methods_of_local_class():
+    """Test a staticmethod of a class defined in a function checks every argument."""
+    parser = _make_parser()()
+    assert parser.parse(16, 16) == "0x10"
+    assert parser.scale(2) == 4
+
+    with pytest.raises(EnforcedTypingError):
+        parser.parse("not-int", 2)
+    with pytest.raises(EnforcedTypingError):
+        parser.scale("2")
+
+
+def test_methods_of_enforced_class():
+    """Test the methods of an enforced class are found through its wrapper."""
+    service = Service("parser")
+    assert Service.__wrapped__.parse(16, 16) == "0x10"
+    assert service.parse(10, 10) == "10"
+    assert service.scale(2) == 4
+
+    with pytest.raises(EnforcedTypingError):
+        Service.__wrapped__.parse("not-int", 10)
+    with pytest.raises(EnforcedTypingError):
+        service.parse("not-int", 10)
+    with pytest.raises(EnforcedTypingError):
+        service.scale("2")
+    with pytest.raises(EnforcedTypingError):
+        Service(1)
+
+
+def test_property():
+    """Test the getter and setter of a property are enforced."""
+    account = Account(1)
+    assert account.balance == 1
+
+    account.balance = 2
+    assert account.balance == 2
+
+    with pytest.raises(EnforcedTypingError):
+        account.balance = "3"
+
+    account._balance = "3"  # pylint: disable=W0212
+    with pytest.raises(EnforcedTypingError):
+        assert account.balance
+
+
+def test_standard_class():
+    """Test a standard class is checked against the hints of its __init__."""
+    customer = Customer("Sam", 30)
+    assert isinstance(customer, Customer.__wrapped__)
+
+    with pytest.raises(EnforcedTypingError):
+        Customer("Sam", "30")
+    with pytest.raises(EnforcedTypingError):
+        Customer(name=30, age=30)
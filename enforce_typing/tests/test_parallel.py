@@ -0,0 +1,90 @@
+"""Test enforce typing module checking large containers across a pool."""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Example executor which counts the chunks submitted to it."""
+
+    def __init__(self):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_enforce_typing_parallel_list():
+    """Test large lists are checked in chunks, reporting the first failing index."""
+    with _CountingExecutor() as executor:
+
+        @enforce_typing(
+            parallel_threshold=100, parallel_executor=executor, parallel_chunks=4
+        )
+        def total(values: List[int]) -> int:
+            return len(values)
+
+        assert total(list(range(99))) == 99
+        assert executor.submitted == 0
+
+        assert total(list(range(10_000))) == 10_000
+        assert executor.submitted == 4
+
+        values = list(range(10_000))
+        values[9_000] = "9000"
+        values[1_234] = "1234"
+        for _ in range(5):
+            with pytest.raises(
+                EnforcedTypingError, match="has a str at index 1234, but should be int"
+            ):
+                total(values)
+
+
+def test_enforce_typing_parallel_dict():
+    """Test large dicts are split into one chunk per CPU by default."""
+    with _CountingExecutor() as executor:
+
+        @enforce_typing(parallel_threshold=100, parallel_executor=executor)
+        def count(values: Dict[str, int]) -> int:
+            return len(values)
+
+        values = {str(index): index for index in range(10_000)}
+        assert count(values) == 10_000
+        assert executor.submitted == (os.cpu_count() or 1)
+
+        values["5000"] = 5000.0
+        with pytest.raises(EnforcedTypingError, match="a value type of float"):
+            count(values)
+
+
+def test_enforce_typing_parallel_processes():
+    """Test picklable items may be checked on a process pool."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+
+        @enforce_typing(parallel_threshold=10, parallel_executor=executor)
+        def total(values: List[int]) -> int:
+            return len(values)
+
+        assert total(list(range(1_000))) == 1_000
+
+        with pytest.raises(EnforcedTypingError, match="has a float at index 500"):
+            total(list(range(500)) + [1.0] + list(range(499)))
+
+
+def test_enforce_typing_parallel_invalid_options():
+    """Test invalid parallel options are rejected when decorating."""
+    with pytest.raises(ValueError, match="threshold must be at least 1"):
+        enforce_typing(parallel_threshold=0)(len)
+
+    with pytest.raises(ValueError, match="executor must be"):
+        enforce_typing(parallel_threshold=10, parallel_executor="fibre")(len)
+
+    with pytest.raises(ValueError, match="chunks must be at least 1"):
+        enforce_typing(parallel_threshold=10, parallel_chunks=0)(len)
@@ -0,0 +1,52 @@
+"""Test pickling functions decorated with enforce_typing."""
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+@enforce_typing
+def total(arg_a: List[int]) -> int:
+    """Add up a list of numbers, used as a picklable example."""
+    return sum(arg_a)
+
+
+def halve(arg_a: int) -> int:
+    """Halve a number, decorated separately in the tests below."""
+    return arg_a // 2
+
+
+def test_wrapper_metadata():
+    """Test the decorated function keeps the metadata of the original."""
+    assert total.__name__ == "total"
+    assert total.__qualname__ == "total"
+    assert total.__module__ == __name__
+    assert total.__doc__ == "Add up a list of numbers, used as a picklable example."
+
+
+def test_pickle_by_reference():
+    """Test a decorated module level function unpickles to itself."""
+    total([1, 2])
+    assert pickle.loads(pickle.dumps(total)) is total
+
+
+def test_pickle_renamed_wrapper():
+    """Test a wrapper bound to another name than its function cannot be pickled."""
+    enforced_halve = enforce_typing(halve)
+    assert enforced_halve(4) == 2
+
+    with pytest.raises(pickle.PicklingError):
+        pickle.dumps(enforced_halve)
+
+
+def test_process_pool():
+    """Test decorated functions can be run in a process pool."""
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(total, [[1, 2], [3, 4]])) == [3, 7]
+
+        with pytest.raises(EnforcedTypingError):
+            executor.submit(total, [1, "2"]).result()
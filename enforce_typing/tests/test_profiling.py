@@ -0,0 +1,99 @@
+"""Test profiling the cost of enforcing types."""
+import io
+import threading
+from typing import List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+from ..profiling import Profiler, profile
+
+
+@enforce_typing
+def _first(arg_a: List[int], arg_b: int) -> int:
+    """Return the first item of a list, used as a profiled example."""
+    return arg_a[0] + arg_b
+
+
+def test_profile_attributes_annotations():
+    """Test each annotation and call site is recorded separately."""
+    with profile(file=False) as profiler:
+        for _ in range(3):
+            _first([1, 2], 1)
+
+        with pytest.raises(EnforcedTypingError):
+            _first(["1"], 1)
+
+    assert Profiler.active is None
+
+    calls, failures = {}, {}
+    for key, stats in profiler.stats.items():
+        calls[key[:3]] = calls.get(key[:3], 0) + stats.calls
+        failures[key[:3]] = failures.get(key[:3], 0) + stats.failures
+
+    assert calls == {
+        ("_first", "arg_a", "List[int]"): 4,
+        ("_first", "arg_b", "int"): 3,
+        ("_first", "return", "int"): 3,
+    }
+    assert failures[("_first", "arg_a", "List[int]")] == 1
+    assert len({key[3] for key in profiler.stats}) == 2
+    assert all(key[3].startswith(__file__) for key in profiler.stats)
+
+
+class _GateMeta(type):
+    """Metaclass which holds up type checks until two threads are checking."""
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def __subclasscheck__(cls, subclass):
+        cls.barrier.wait()
+        return True
+
+
+class _Gate(metaclass=_GateMeta):  # pylint: disable=R0903
+    """Example annotation whose checks wait for each other."""
+
+
+@enforce_typing
+def _gated(arg_a: _Gate):
+    """Return the argument, once another thread is checking its own."""
+    return arg_a
+
+
+def test_profile_threads():
+    """Test checks made at the same time are attributed to their own call site."""
+    with profile(file=False, allocations=False) as profiler:
+        other = threading.Thread(target=lambda: _gated(1))
+        other.start()
+        _gated(2)
+        other.join()
+
+    call_sites = {key[3]: stats.calls for key, stats in profiler.stats.items()}
+    assert len(call_sites) == 2
+    assert set(call_sites.values()) == {1}
+
+
+def test_profile_report():
+    """Test a sorted report is printed when the block exits."""
+    report = io.StringIO()
+    with profile(file=report, allocations=False) as profiler:
+        _first([1], 1)
+
+    lines = report.getvalue().splitlines()
+    assert lines[0] == "Hot annotations"
+    assert len(lines) == 2 + len(profiler.stats)
+    assert "_first(arg_a: List[int]) called at" in report.getvalue()
+
+    times = [float(line.split()[0]) for line in lines[2:]]
+    assert times == sorted(times, reverse=True)
+
+
+def test_not_profiled():
+    """Test calls outside of a profile block are not recorded."""
+    with profile(file=False) as profiler:
+        pass
+
+    _first([1], 1)
+    assert not profiler.stats
@@ -0,0 +1,158 @@
+"""Test enforce typing module reporting violations instead of raising them."""
+import gc
+import logging
+import weakref
+from typing import List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+
+try:
+    from typing import Literal
+
+except ImportError:  # Python 3.7
+    Literal = None
+
+
+class _CountedRepr:
+    """Example value which counts how often its repr is formatted."""
+
+    reprs = 0
+
+    def __repr__(self) -> str:
+        _CountedRepr.reprs += 1
+        return "_CountedRepr()"
+
+
+def test_enforce_typing_log(caplog):
+    """Test violations are logged as warnings, and the call still runs."""
+
+    @enforce_typing(on_error="log")
+    def double(value: int) -> int:
+        return value * 2
+
+    with caplog.at_level(logging.WARNING, logger="enforce_typing"):
+        assert double("a") == "aa"
+
+    assert len(caplog.records) == 2
+    assert "double: 'value' is a <class 'str'>" in caplog.records[0].getMessage()
+    assert "'return' is a <class 'str'>" in caplog.records[1].getMessage()
+
+
+def test_enforce_typing_callback_deduplicates():
+    """Test repeats of a violation are only reported once per interval."""
+    reports = []
+
+    @enforce_typing(on_error=lambda func, error: reports.append(str(error)))
+    def total(values: List[int], scale: int) -> int:
+        return len(values) * int(scale)
+
+    for _ in range(100):
+        total([1], "2")
+        total([1, "2"], 2)
+
+    assert reports == [
+        "'scale' is a <class 'str'>, but should be <class 'int'>.",
+        "'values' has a str at index 1, but should be int.",
+    ]
+
+
+@pytest.mark.skipif(Literal is None, reason="typing.Literal needs Python 3.8")
+def test_enforce_typing_report_defers_formatting():
+    """Test repeated violations are recognised without formatting a message."""
+    reports = []
+    _CountedRepr.reprs = 0
+
+    @enforce_typing(on_error=lambda func, error: reports.append(error))
+    def handle(kind: Literal["ping", "pong"]) -> None:
+        pass
+
+    for _ in range(100):
+        handle(_CountedRepr())
+
+    assert len(reports) == 1
+    assert _CountedRepr.reprs == 1
+
+
+def test_enforce_typing_report_limit():
+    """Test a function stops being checked once it reaches max_reports."""
+    reports = []
+
+    @enforce_typing(on_error=lambda func, error: reports.append(error), max_reports=2)
+    def echo(value: int) -> None:
+        pass
+
+    for value in ("a", 1.0, b"a", None):
+        echo(value)
+
+    assert len(reports) == 2
+
+
+def test_enforce_typing_report_with_adaptive():
+    """Test calls whose violations were reported are not cached as passing."""
+    reports = []
+
+    @enforce_typing(
+        adaptive=True,
+        on_error=lambda func, error: reports.append(error),
+        report_interval=0,
+    )
+    def echo(value: int) -> None:
+        pass
+
+    for _ in range(3):
+        echo("a")
+
+    assert len(reports) == 3
+
+
+def test_enforce_typing_suppressed_frees_values():
+    """Test a suppressed violation does not keep the checked value alive."""
+
+    @enforce_typing(on_error=lambda func, error: None)
+    def identity(value: int) -> int:
+        return value
+
+    identity(_CountedRepr())
+
+    value = _CountedRepr()
+    values = weakref.ref(value)
+    assert identity(value) is value
+
+    del value
+    assert values() is None
+
+
+def _call_in_handler(func: callable, value: any) -> weakref.ref:
+    """Call func inside an except block, returning a reference to a handler local."""
+    try:
+        raise KeyError("handled")
+
+    except KeyError:
+        local = _CountedRepr()
+        func(value)
+        return weakref.ref(local)
+
+
+def test_enforce_typing_suppressed_in_handler_frees_values():
+    """Test a violation suppressed inside an except block does not keep it alive."""
+
+    @enforce_typing(on_error=lambda func, error: None)
+    def identity(value: int) -> int:
+        return value
+
+    identity(_CountedRepr())
+
+    locals_ = _call_in_handler(identity, _CountedRepr())
+    gc.collect()
+    assert locals_() is None
+
+
+def test_enforce_typing_invalid_on_error():
+    """Test an unknown on_error option is rejected when decorating."""
+    with pytest.raises(ValueError, match="on_error must be"):
+
+        @enforce_typing(on_error="warn")
+        def echo(value: int) -> None:
+            pass
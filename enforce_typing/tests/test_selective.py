@@ -0,0 +1,168 @@
+"""Test enforcing a selection of arguments, or a sample of calls."""
+from typing import List
+
+import pytest
+
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+from ..sampling import EveryNthCall, RandomSampler
+
+
+def test_parameters():
+    """Test only the named parameters are checked."""
+
+    @enforce_typing(parameters=["arg_a"])
+    def test_params(arg_a: int, arg_b: int) -> int:
+        return arg_a
+
+    assert test_params(1, "2") == 1
+
+    with pytest.raises(EnforcedTypingError):
+        test_params("1", 2)
+    with pytest.raises(EnforcedTypingError):
+        test_params(arg_a="1", arg_b=2)
+
+
+def test_no_parameters():
+    """Test an empty list of parameters checks no arguments."""
+
+    @enforce_typing(parameters=[])
+    def test_params(arg_a: int) -> str:
+        return arg_a
+
+    assert test_params("1") == "1"
+
+
+def test_property_parameters():
+    """Test the parameters of a property are those of any of its accessors."""
+
+    class Example:
+        """Example class for testing purposes."""
+
+        def __init__(self):
+            self._value = 0
+
+        @property
+        def value(self) -> int:
+            """Return the value."""
+            return self._value
+
+        @enforce_typing(parameters=["value"], check_return=False)
+        @value.setter
+        def value(self, value: int):
+            """Set the value."""
+            self._value = value
+
+    example = Example()
+    example.value = 1
+    example._value = "2"  # pylint: disable=W0212
+    assert example.value == "2"
+
+    with pytest.raises(EnforcedTypingError):
+        example.value = "3"
+
+    with pytest.raises(ValueError):
+        enforce_typing(Example.value.fget, parameters=["value"])
+    with pytest.raises(ValueError):
+        enforce_typing(property(Example.value.fget), parameters=["arg_a"])
+
+
+def test_unknown_parameters():
+    """Test naming a parameter the function does not have is an error."""
+    with pytest.raises(ValueError):
+
+        @enforce_typing(parameters=["arg_c"])
+        def test_params(arg_a: int) -> int:  # pylint: disable=W0612
+            return arg_a
+
+
+def test_check_arguments_only():
+    """Test the return value is not checked with check_return=False."""
+
+    @enforce_typing(check_return=False)
+    def test_args(arg_a: int) -> str:
+        return arg_a
+
+    assert test_args(1) == 1
+
+    with pytest.raises(EnforcedTypingError):
+        test_args("1")
+
+
+def test_check_return_only():
+    """Test the arguments are not checked with check_arguments=False."""
+
+    @enforce_typing(check_arguments=False)
+    def test_return(arg_a: int) -> str:
+        return arg_a
+
+    assert test_return("1") == "1"
+
+    with pytest.raises(EnforcedTypingError):
+        test_return(1)
+
+
+def test_sample_every_nth_call():
+    """Test only one in every n calls is checked."""
+
+    @enforce_typing(sample=3)
+    def test_sample(arg_a: int) -> int:
+        return arg_a
+
+    with pytest.raises(EnforcedTypingError):
+        test_sample("1")
+
+    assert test_sample("2") == "2"
+    assert test_sample("3") == "3"
+
+    with pytest.raises(EnforcedTypingError):
+        test_sample("4")
+
+
+def test_sampled_parameters():
+    """Test parameters not named in sampled_parameters are always checked."""
+
+    @enforce_typing(sample=EveryNthCall(2), sampled_parameters=["arg_b"])
+    def test_sample(arg_a: int, arg_b: List[int]) -> int:
+        return arg_a
+
+    with pytest.raises(EnforcedTypingError):
+        test_sample(1, ["2"])
+
+    assert test_sample(1, ["2"]) == 1
+
+    with pytest.raises(EnforcedTypingError):
+        test_sample("1", [2])
+
+
+def test_random_sampler():
+    """Test the random sampler is repeatable with a seed."""
+    first, second = RandomSampler(0.5, seed=1), RandomSampler(0.5, seed=1)
+    selected = [first() for _ in range(100)]
+
+    assert selected == [second() for _ in range(100)]
+    assert 0 < sum(selected) < 100
+    assert not any(RandomSampler(0)() for _ in range(100))
+    assert all(RandomSampler(1)() for _ in range(100))
+
+    with pytest.raises(ValueError):
+        RandomSampler(2)
+    with pytest.raises(ValueError):
+        EveryNthCall(0)
+
+
+def test_options_with_methods():
+    """Test options are applied through staticmethods."""
+
+    class Example:  # pylint: disable=R0903
+        """Example class for testing purposes."""
+
+        @enforce_typing(check_return=False)
+        @staticmethod
+        def test_static(arg_a: int) -> str:
+            return arg_a
+
+    assert Example.test_static(1) == 1
+
+    with pytest.raises(EnforcedTypingError):
+        Example.test_static("1")
@@ -1,4 +1,6 @@
 """Test enforce typing module on stdlib type hints."""
+from typing import Any
+
 import pytest
 
 from ..enforce_typing import enforce_typing
@@ -171,3 +173,15 @@ def test_enforce_typing_return_type_dict():
 
     with pytest.raises(EnforcedTypingError):
         test_fail_return_dict({1: "1"})
+
+
+def test_enforce_typing_any_and_object():
+    """Test typing.Any and object accept every value."""
+
+    @enforce_typing
+    def test_any(arg_a: Any, arg_b: object) -> Any:
+        return arg_a
+
+    assert test_any(1, "1") == 1
+    assert test_any(None, None) is None
+    assert test_any([1], {1: "1"}) == [1]
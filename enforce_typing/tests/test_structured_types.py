@@ -0,0 +1,125 @@
+"""Test enforce typing module on TypedDicts and nested dataclasses."""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, TypedDict
+
+import pytest
+
+from .test_classes import User
+from ..check_structured_types import record_checker
+from ..enforce_typing import enforce_typing
+from ..exceptions import EnforcedTypingError
+
+
+class Address(TypedDict):
+    """Example TypedDict for testing purposes."""
+
+    street: str
+    postcode: str
+
+
+class Contact(TypedDict, total=False):
+    """Example TypedDict with optional keys for testing purposes."""
+
+    email: str
+    phone: str
+
+
+class Order(TypedDict):
+    """Example TypedDict containing other records for testing purposes."""
+
+    order_id: int
+    address: Address
+    contact: Contact
+    users: List[User]
+
+
+@dataclass
+class Team:
+    """Example dataclass containing other records for testing purposes."""
+
+    name: str
+    members: List[User]
+    lead: Optional[User] = None
+    parent: Optional["Team"] = None
+    address: Address = field(default_factory=lambda: {"street": "", "postcode": ""})
+
+
+def _order(**overrides) -> dict:
+    """Return a valid Order, with some keys replaced."""
+    order = {
+        "order_id": 1,
+        "address": {"street": "1 Main Street", "postcode": "AB1 2CD"},
+        "contact": {"email": "sam@example.com"},
+        "users": [User("Sam", 30)],
+    }
+    order.update(overrides)
+    return order
+
+
+def test_enforce_typing_typeddict():
+    """Test the enforce_typing decorator with a nested TypedDict."""
+
+    @enforce_typing
+    def test_order(arg_a: Order) -> int:
+        return arg_a["order_id"]
+
+    assert test_order(_order()) == 1
+    assert test_order(_order(contact={})) == 1
+
+    with pytest.raises(EnforcedTypingError, match=r"'arg_a\['order_id'\]' is a str"):
+        test_order(_order(order_id="1"))
+    with pytest.raises(EnforcedTypingError, match=r"\['address'\]\['postcode'\]"):
+        test_order(_order(address={"street": "1 Main Street", "postcode": 1}))
+    with pytest.raises(EnforcedTypingError, match=r"\['users'\]\[0\]\.age"):
+        test_order(_order(users=[User("Sam", "30")]))
+    with pytest.raises(EnforcedTypingError, match="is required by Address"):
+        test_order(_order(address={"street": "1 Main Street"}))
+    with pytest.raises(EnforcedTypingError, match="is not a key of Contact"):
+        test_order(_order(contact={"fax": "01234"}))
+    with pytest.raises(EnforcedTypingError):
+        test_order([_order()])
+
+
+def test_enforce_typing_dataclass():
+    """Test the enforce_typing decorator with a nested dataclass."""
+
+    @enforce_typing
+    def test_team(arg_a: Team) -> List[str]:
+        return [member.name for member in arg_a.members]
+
+    team = Team("Core", [User("Sam", 30)], lead=User("Alex", 40))
+    assert test_team(team) == ["Sam"]
+    assert test_team(Team("Sub", [], parent=team)) == []
+
+    with pytest.raises(EnforcedTypingError, match=r"'arg_a\.members\[1\]\.age'"):
+        test_team(Team("Core", [User("Sam", 30), User("Alex", "40")]))
+    with pytest.raises(EnforcedTypingError, match=r"'arg_a\.lead' is a str"):
+        test_team(Team("Core", [], lead="Alex"))
+    with pytest.raises(EnforcedTypingError, match=r"'arg_a\.parent\.name'"):
+        test_team(Team("Sub", [], parent=Team(1, [])))
+    with pytest.raises(EnforcedTypingError, match=r"\.address\['street'\]"):
+        test_team(Team("Core", [], address={"street": 1, "postcode": ""}))
+
+
+def test_enforce_typing_records_in_containers():
+    """Test records nested in Typing containers, and return values."""
+
+    @enforce_typing
+    def test_records(arg_a: Dict[str, Address]) -> List[Contact]:
+        return [{"email": key} for key in arg_a]
+
+    assert test_records({"home": {"street": "", "postcode": ""}}) == [{"email": "home"}]
+
+    with pytest.raises(EnforcedTypingError, match=r"'arg_a\['home'\]\['street'\]'"):
+        test_records({"home": {"street": 1, "postcode": ""}})
+
+
+def test_record_checker_is_cached():
+    """Test each record type is compiled once."""
+    assert record_checker(Team) is record_checker(Team)
+    assert record_checker(Address) is record_checker(Address)
+    assert record_checker(Team)(Team("Core", [])) is None
+    assert record_checker(Address)({"street": ""}) == (
+        "['postcode']",
+        "is required by Address.",
+    )
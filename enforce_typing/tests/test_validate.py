@@ -0,0 +1,109 @@
+"""Test the JSON Lines validator."""
+import io
+import json
+
+import pytest
+
+from ..validate import main, read_chunks, validate_stream
+
+ORDER = "enforce_typing.tests.test_structured_types:Order"
+TEAM = "enforce_typing.tests.test_structured_types:Team"
+
+
+def _order(**overrides) -> dict:
+    """Return a valid Order as JSON, with some keys replaced."""
+    order = {
+        "order_id": 1,
+        "address": {"street": "1 Main Street", "postcode": "AB1 2CD"},
+        "contact": {},
+        "users": [{"name": "Sam", "age": 30}],
+    }
+    order.update(overrides)
+    return json.dumps(order)
+
+
+def _lines() -> str:
+    """Return JSON Lines with failures on lines 3, 4 and 6."""
+    return "\n".join(
+        [
+            _order(),
+            "",
+            _order(order_id="1"),
+            "{not json",
+            _order(),
+            _order(users=[{"name": "Sam", "age": "30"}]),
+        ]
+    )
+
+
+def test_validate_stream():
+    """Test failing line numbers are reported in order."""
+    failures = list(validate_stream(ORDER, io.StringIO(_lines()), chunk_size=2))
+
+    assert [failure.split(":")[0] for failure in failures] == ["3", "4", "6"]
+    assert failures[0] == "3: 'record['order_id']' is a str, but should be int."
+    assert failures[2] == "6: 'record['users'][0]['age']' is a str, but should be int."
+
+
+def test_validate_stream_process_pool():
+    """Test validating across processes gives the same result."""
+    assert list(
+        validate_stream(ORDER, io.StringIO(_lines()), workers=2, chunk_size=1)
+    ) == list(validate_stream(ORDER, io.StringIO(_lines())))
+
+
+def test_validate_dataclass_as_mapping():
+    """Test dataclasses are validated as JSON objects of their fields."""
+    lines = "\n".join(
+        [
+            json.dumps({"name": "Core", "members": [{"name": "Sam", "age": 30}]}),
+            json.dumps({"name": "Core"}),
+            json.dumps({"name": "Core", "members": [], "lead": {"name": 1, "age": 2}}),
+        ]
+    )
+
+    assert list(validate_stream(TEAM, io.StringIO(lines))) == [
+        "2: 'record['members']' is required by Team.",
+        "3: 'record['lead']['name']' is a int, but should be str.",
+    ]
+
+
+def test_read_chunks():
+    """Test lines are numbered, blank lines skipped, and chunks bounded."""
+    chunks = read_chunks(io.StringIO("a\n\nb\nc\n"), chunk_size=2)
+
+    assert next(chunks) == [(1, "a\n"), (3, "b\n")]
+    assert next(chunks) == [(4, "c\n")]
+    with pytest.raises(StopIteration):
+        next(chunks)
+
+
+def test_main(tmp_path, capsys):
+    """Test the command line entry point."""
+    records = tmp_path / "records.jsonl"
+    records.write_text(_lines())
+
+    assert main([ORDER, str(records)]) == 1
+    assert capsys.readouterr().out.splitlines()[0] == (
+        f"{records}:3: 'record['order_id']' is a str, but should be int."
+    )
+
+    records.write_text(_order())
+    assert main([ORDER, str(records)]) == 0
+    missing = "enforce_typing.tests.test_structured_types:Missing"
+    assert main([missing, str(records)]) == 2
+    assert main([ORDER, str(tmp_path / "missing.jsonl")]) == 2
+
+
+@pytest.mark.parametrize("option", ["--workers", "--chunk-size"])
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_main_rejects_invalid_counts(tmp_path, capsys, option, value):
+    """Test worker and chunk counts must be positive ints."""
+    records = tmp_path / "records.jsonl"
+    records.write_text(_lines())
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([ORDER, str(records), option, value])
+
+    assert exit_info.value.code == 2
+    assert option in capsys.readouterr().err
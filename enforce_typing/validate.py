@@ -0,0 +1,258 @@
+"""Validate a JSON Lines file against a TypedDict or dataclass.
+
+Usage:
+    python -m enforce_typing.validate module:Type records.jsonl
+
+Records are streamed from the file, or from stdin if no file or "-"
+is given, and checked with the same checkers as the enforce_typing
+decorator. Dataclasses are checked as JSON objects of their fields.
+Each failing line is reported as "file:line: message", and the exit
+status is 1 if any record failed.
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import functools
+import importlib
+import inspect
+import itertools
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, TextIO
+
+from .check_structured_types import compile_structure_checker
+
+
+@functools.lru_cache(maxsize=None)
+def load_checker(type_path: str) -> callable:
+    """
+    Import a type from "module:Type" and compile a checker for it.
+
+    Args:
+        type_path: str
+            The module and qualified name of the type,
+            separated by a colon, e.g. "app.models:Order".
+
+    Returns: callable
+        A function taking a record, which returns None if the
+        record matches, or a (location, message) tuple.
+    """
+    module_name, _, qualname = type_path.partition(":")
+    if not module_name or not qualname:
+        raise ValueError(f"'{type_path}' should be in the form module:Type.")
+
+    found = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        found = getattr(found, attribute)
+
+    return compile_structure_checker(inspect.unwrap(found), as_mappings=True)
+
+
+def validate_lines(type_path: str, lines: list[tuple[int, str]]) -> list[str]:
+    """
+    Validate numbered lines of JSON against a type.
+
+    Args:
+        type_path: str
+            The type to validate against, as "module:Type".
+
+        lines: list[tuple[int, str]]
+            The line numbers and text of the records.
+
+    Returns: list[str]
+        A message for each line which failed, prefixed
+        with its line number.
+    """
+    checker = load_checker(type_path)
+    failures = []
+
+    for line_number, line in lines:
+        try:
+            record = json.loads(line)
+
+        except ValueError as error:
+            failures.append(f"{line_number}: invalid JSON, {error}")
+            continue
+
+        mismatch = checker(record)
+        if mismatch is not None:
+            location, message = mismatch
+            failures.append(f"{line_number}: 'record{location}' {message}")
+
+    return failures
+
+
+def read_chunks(stream: TextIO, chunk_size: int) -> Iterator[list[tuple[int, str]]]:
+    """Yield lists of up to chunk_size numbered, non-blank lines."""
+    numbered_lines = (
+        (line_number, line)
+        for line_number, line in enumerate(stream, start=1)
+        if line.strip()
+    )
+
+    while True:
+        chunk = list(itertools.islice(numbered_lines, chunk_size))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _map_bounded(
+    executor: ProcessPoolExecutor,
+    func: callable,
+    chunks: Iterable[list[tuple[int, str]]],
+    max_pending: int,
+) -> Iterator[list[str]]:
+    """
+    Like executor.map, but only reads ahead max_pending chunks.
+
+    Executor.map submits every item before returning, which would
+    read the whole file into memory.
+    """
+    pending = collections.deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, chunk))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def validate_stream(
+    type_path: str,
+    stream: TextIO,
+    workers: int = 1,
+    chunk_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Validate each line of a stream, yielding a message for each failure.
+
+    Args:
+        type_path: str
+            The type to validate against, as "module:Type".
+
+        stream: TextIO
+            The JSON Lines to validate.
+
+        workers: int
+            The number of processes to validate with.
+            1 validates in this process.
+
+        chunk_size: int
+            The number of lines sent to a process at once.
+
+    Returns: Iterator[str]
+        A message for each line which failed, in line order.
+    """
+    load_checker(type_path)
+    validate_chunk = functools.partial(validate_lines, type_path)
+    chunks = read_chunks(stream, chunk_size)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from validate_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for failures in _map_bounded(executor, validate_chunk, chunks, workers * 2):
+            yield from failures
+
+
+def _positive_int(text: str) -> int:
+    """Convert a command line argument to an int of at least 1."""
+    try:
+        value = int(text)
+
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not an int") from None
+
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+
+    return value
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m enforce_typing.validate",
+        description="Validate a JSON Lines file against a TypedDict or dataclass.",
+    )
+    parser.add_argument("type", help="the type to validate against, as module:Type")
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="the JSON Lines file to validate, or - for stdin (the default)",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=_positive_int,
+        default=1,
+        help="the number of processes to validate with (default 1)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        default=1000,
+        help="the number of lines sent to a process at once (default 1000)",
+    )
+    return parser.parse_args(argv)
+
+
+def _report_failures(args: argparse.Namespace, stream: TextIO, source: str) -> int:
+    """Print each failing line of a stream, and return the number of failures."""
+    failed = 0
+    for failure in validate_stream(
+        args.type,
+        stream,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    ):
+        failed += 1
+        print(f"{source}:{failure}")
+
+    if failed:
+        print(f"{failed} record(s) failed validation.", file=sys.stderr)
+
+    return failed
+
+
+def main(argv: list[str] = None) -> int:
+    """
+    Run the validator from the command line.
+
+    Returns: int
+        0 if every record is valid, 1 if any
+        record failed, and 2 for usage errors.
+    """
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+
+    try:
+        load_checker(args.type)
+
+    except (ImportError, AttributeError, ValueError) as error:
+        print(f"error: cannot load {args.type}, {error}", file=sys.stderr)
+        return 2
+
+    if args.file == "-":
+        return 1 if _report_failures(args, sys.stdin, "<stdin>") else 0
+
+    try:
+        with open(args.file, encoding="utf-8") as stream:
+            return 1 if _report_failures(args, stream, args.file) else 0
+
+    except OSError as error:
+        print(f"error: cannot read {args.file}, {error}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,394 @@
+"""Module to pre-compute the checks applied to a decorated callable."""
+from __future__ import annotations
+
+import collections
+import copy
+import inspect
+import re
+import typing
+
+from .check_builtin_types import compile_builtin_checker
+from .check_callable_types import compile_callable_checker, is_callable_type
+from .check_future_or_typing_types import compile_typing_checker
+from .check_generic_types import compile_bound_checker, ignore_bindings
+from .check_literal_types import (
+    compile_enum_checker,
+    compile_literal_checker,
+    contains_literal_type,
+    is_enum_type,
+    is_literal_type,
+)
+from .check_structured_types import (
+    compile_structure_checker,
+    contains_record_type,
+    contains_type_var,
+    type_vars_in,
+)
+from .exceptions import EnforcedTypingError
+from .parallel import ParallelChecker
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_SIGNATURE_END = object()
+
+
+def _is_typing_type(type_hint: any) -> bool:
+    """Return True if the type hint is a Typing or __future__ generic."""
+    return type(type_hint).__qualname__ == "_GenericAlias" or bool(
+        re.match(r"(^[a-z]*\[.*\]$)", str(type_hint))
+    )
+
+
+def _resolve_string_hints(annotated: any, type_hints: dict[str, any]):
+    """
+    Replace string type hints, e.g. from __future__ annotations, with objects.
+
+    Hints which cannot be evaluated on this version of Python
+    are left as strings, and are checked as they were written.
+    """
+    if not any(isinstance(type_hint, str) for type_hint in type_hints.values()):
+        return type_hints
+
+    try:
+        resolved_hints = typing.get_type_hints(annotated)
+
+    except Exception:  # pylint: disable=W0703
+        return type_hints
+
+    return {
+        arg_name: (
+            resolved_hints.get(arg_name, type_hint)
+            if isinstance(type_hint, str)
+            else type_hint
+        )
+        for arg_name, type_hint in type_hints.items()
+    }
+
+
+def _get_type_hints(func: callable) -> dict[str, any]:
+    """
+    Return a copy of the type hints applied to a function or class.
+
+    Classes use their own annotations where present (e.g. dataclasses),
+    otherwise the annotations of their __init__ method. The return
+    annotation of a class is dropped, as calling a class always
+    returns an instance of it.
+    """
+    if not inspect.isclass(func):
+        return _resolve_string_hints(func, dict(getattr(func, "__annotations__", {})))
+
+    type_hints = dict(func.__dict__.get("__annotations__", {}))
+    if type_hints:
+        return _resolve_string_hints(func, type_hints)
+
+    type_hints = dict(getattr(func.__init__, "__annotations__", {}))
+    type_hints.pop("return", None)
+
+    return _resolve_string_hints(func.__init__, type_hints)
+
+
+def _get_positional_parameters(func: callable) -> tuple[str, ...]:
+    """Return the names of the parameters which can be passed positionally."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+
+    except (TypeError, ValueError):
+        return ()
+
+    return tuple(
+        parameter.name
+        for parameter in parameters
+        if parameter.kind in _POSITIONAL_KINDS
+    )
+
+
+def _is_generic_type(type_hint: any) -> bool:
+    """Return True if the type hint binds TypeVars, excluding Callable signatures."""
+    return contains_type_var(type_hint) and not is_callable_type(type_hint)
+
+
+def _compile_structured_checker(arg_name: str, type_hint: any) -> callable:
+    """Create a function which checks a hint containing records or Literals."""
+    structure_checker = compile_structure_checker(type_hint)
+
+    def check_structured_type(arg_value: any):
+        mismatch = structure_checker(arg_value)
+        if mismatch is not None:
+            location, message = mismatch
+            raise EnforcedTypingError(f"'{arg_name}{location}' {message}")
+
+    return check_structured_type
+
+
+_HINT_COMPILERS = (
+    (_is_generic_type, compile_bound_checker),
+    (contains_record_type, _compile_structured_checker),
+    (is_callable_type, compile_callable_checker),
+    (is_literal_type, compile_literal_checker),
+    (contains_literal_type, _compile_structured_checker),
+    (is_enum_type, compile_enum_checker),
+)
+
+
+def compile_checker(
+    arg_name: str,
+    type_hint: any,
+    parallel: ParallelChecker = None,
+) -> callable:
+    """
+    Create a function which checks a value against a type hint.
+
+    Args:
+        arg_name: str
+            The name of the argument, or "return".
+
+        type_hint: any
+            The type hint applied to the argument.
+
+        parallel: ParallelChecker
+            Used to check the items of large Typing
+            lists and dicts across a pool.
+
+    Returns: callable
+        A function taking the value to check, which raises
+        an EnforcedTypingError if the value does not match
+        the type hint. Checkers whose result only depends
+        on the type of the value have checks_type_only set.
+        Checkers of hints containing TypeVars also take the
+        dict of TypeVars bound so far in the call, and have
+        binds_type_vars set.
+    """
+    for matches, compile_hint_checker in _HINT_COMPILERS:
+        if matches(type_hint):
+            return compile_hint_checker(arg_name, type_hint)
+
+    if _is_typing_type(type_hint):
+        return compile_typing_checker(arg_name, str(type_hint), parallel)
+
+    return compile_builtin_checker(arg_name, type_hint)
+
+
+class ValidationPlan:
+    """Checks compiled once from the type hints of a decorated callable."""
+
+    def __init__(
+        self,
+        func: callable,
+        skip_receiver: bool = False,
+        parallel: ParallelChecker = None,
+    ):
+        """
+        Create a ValidationPlan for a function or class.
+
+        Args:
+            func: callable
+                The function or class being decorated.
+
+            skip_receiver: bool
+                Whether the first parameter is the self or
+                cls of a method, and should not be checked.
+
+            parallel: ParallelChecker
+                Used to check the items of large Typing
+                lists and dicts across a pool.
+        """
+        self.type_hints = _get_type_hints(func)
+        self.parameters = _get_positional_parameters(func)
+
+        if skip_receiver and self.parameters:
+            self.type_hints.pop(self.parameters[0], None)
+
+        self.argument_checkers: dict[str, callable] = {
+            arg_name: compile_checker(arg_name, type_hint, parallel)
+            for arg_name, type_hint in self.type_hints.items()
+            if arg_name != "return"
+        }
+        self.positional_checkers: tuple[tuple[int, callable], ...] = tuple(
+            (index, self.argument_checkers[arg_name])
+            for index, arg_name in enumerate(self.parameters)
+            if arg_name in self.argument_checkers
+        )
+        self.return_checker = (
+            compile_checker("return", self.type_hints["return"], parallel)
+            if "return" in self.type_hints
+            else None
+        )
+        self.type_only_names = frozenset(
+            arg_name
+            for arg_name, checker in self.argument_checkers.items()
+            if getattr(checker, "checks_type_only", False)
+        )
+        self.max_signatures = 0
+        self.signature_count = 0
+        self.signatures: dict[any, dict] = None
+        self.content_plan: ValidationPlan = None
+        self.binds_type_vars = any(
+            getattr(checker, "binds_type_vars", False)
+            for checker in (*self.argument_checkers.values(), self.return_checker)
+        )
+        self._unbound: dict[typing.TypeVar, type] = dict.fromkeys(
+            set().union(*map(type_vars_in, self.type_hints.values()))
+        )
+        self._spare_bindings: collections.deque[dict[typing.TypeVar, type]] = (
+            collections.deque(maxlen=4)
+        )
+        if self.binds_type_vars:
+            self._pass_bindings_to_all_checkers()
+
+    def _pass_bindings_to_all_checkers(self):
+        """Adapt the checkers which do not bind TypeVars to take the bindings."""
+        adapted = self.map_checkers(
+            lambda arg_name, checker: (
+                checker
+                if getattr(checker, "binds_type_vars", False)
+                else ignore_bindings(checker)
+            )
+        )
+        self.argument_checkers = adapted.argument_checkers
+        self.positional_checkers = adapted.positional_checkers
+        self.return_checker = adapted.return_checker
+
+    def take_bindings(self) -> dict[typing.TypeVar, type]:
+        """
+        Return a dict of the TypeVars of the plan, all unbound, for one call.
+
+        Each TypeVar is already a key, mapped to None, and dicts are reused
+        through release_bindings, so binding TypeVars allocates nothing.
+        """
+        try:
+            return self._spare_bindings.pop()
+
+        except IndexError:
+            return self._unbound.copy()
+
+    def release_bindings(self, bindings: dict[typing.TypeVar, type]):
+        """Unbind the TypeVars of a dict from take_bindings, to reuse it."""
+        if len(bindings) == len(self._unbound):
+            bindings.update(self._unbound)
+            self._spare_bindings.append(bindings)
+
+    def cache_signatures(self, max_signatures: int):
+        """
+        Remember the argument types of up to max_signatures passing calls.
+
+        Signatures are kept as a tree of dicts, keyed on the type of each
+        positional argument, then the name and type of each keyword
+        argument, so a call is matched without building a tuple, one
+        dict lookup per argument. Once a call's argument types match a
+        remembered signature, the
+        checks which only depend on the type of an argument are known to
+        pass, and only the checks in content_plan need to be run. If every
+        argument check only depends on the type, content_plan is None, and
+        no argument checks are run at all.
+
+        Args:
+            max_signatures: int
+                The most signatures to remember. Once full,
+                new signatures are checked in full every call.
+        """
+        self.max_signatures = max_signatures
+        self.signature_count = 0
+        self.signatures = {}
+        content_names = set(self.argument_checkers) - self.type_only_names
+        self.content_plan = self.select(content_names) if content_names else None
+
+    def matches_signature(self, args: tuple[any, ...], kwargs: dict[str, any]) -> bool:
+        """Return True if the types of the arguments match a remembered signature."""
+        node = self.signatures
+        for arg_value in args:
+            node = node.get(type(arg_value))
+            if node is None:
+                return False
+
+        if kwargs:
+            for arg_name, arg_value in kwargs.items():
+                node = node.get(arg_name)
+                if node is None:
+                    return False
+
+                node = node.get(type(arg_value))
+                if node is None:
+                    return False
+
+        return _SIGNATURE_END in node
+
+    def remember_signature(self, args: tuple[any, ...], kwargs: dict[str, any]):
+        """Remember the types of the arguments of a call which passed."""
+        if self.signature_count >= self.max_signatures:
+            return
+
+        node = self.signatures
+        for key in (
+            *map(type, args),
+            *(key for item in kwargs.items() for key in (item[0], type(item[1]))),
+        ):
+            node = node.setdefault(key, {})
+
+        if _SIGNATURE_END not in node:
+            node[_SIGNATURE_END] = True
+            self.signature_count += 1
+
+    def select(self, arg_names: set[str]) -> ValidationPlan:
+        """
+        Return a copy of the plan which only checks some arguments.
+
+        Args:
+            arg_names: set[str]
+                The names of the arguments to check,
+                including "return" to check the
+                returned value.
+
+        Returns: ValidationPlan
+            The plan for the selected arguments.
+        """
+        selected = copy.copy(self)
+        selected.argument_checkers = {
+            arg_name: checker
+            for arg_name, checker in self.argument_checkers.items()
+            if arg_name in arg_names
+        }
+        selected.positional_checkers = tuple(
+            (index, checker)
+            for index, checker in self.positional_checkers
+            if self.parameters[index] in arg_names
+        )
+        selected.return_checker = self.return_checker if "return" in arg_names else None
+        selected.max_signatures = 0
+        selected.signature_count = 0
+        selected.signatures = None
+        selected.content_plan = None
+
+        return selected
+
+    def map_checkers(self, wrap: callable) -> ValidationPlan:
+        """
+        Return a copy of the plan with each checker wrapped.
+
+        Args:
+            wrap: callable
+                A function taking an argument name, or
+                "return", and its checker, which returns
+                the checker to use in its place.
+
+        Returns: ValidationPlan
+            The plan with wrapped checkers.
+        """
+        wrapped = copy.copy(self)
+        wrapped.argument_checkers = {
+            arg_name: wrap(arg_name, checker)
+            for arg_name, checker in self.argument_checkers.items()
+        }
+        wrapped.positional_checkers = tuple(
+            (index, wrapped.argument_checkers[self.parameters[index]])
+            for index, _ in self.positional_checkers
+        )
+        wrapped.return_checker = self.return_checker and wrap(
+            "return", self.return_checker
+        )
+        wrapped.content_plan = self.content_plan and self.content_plan.map_checkers(
+            wrap
+        )
+
+        return wrapped
@@ -41,3 +41,10 @@ def test(session):
         "--cov-report",
         "term-missing",
     )
+
+
+@nox.session
+def benchmark(session):
+    """Time adaptive mode against checking every call."""
+    session.install(".")
+    session.run("python", "-m", "enforce_typing.tests.benchmark_adaptive")